@@ -1,15 +1,35 @@
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from functools import lru_cache
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Dict, Generic, Hashable, List, Mapping, Tuple, TypeVar
+from typing import Any, Dict, Generic, Hashable, List, Mapping, Optional, Tuple, TypeVar
+
+from automata.utils import bit_indices, mask_closure
 
 
 class _Epsilon:
     """Singleton sentinel for ε-transitions."""
 
     __slots__ = ()
+    _instance: "_Epsilon | None" = None
+
+    # δ keys and symbol checks compare ε by identity (default hash/eq), so
+    # there must only ever be one instance, including across copy and pickle
+    def __new__(cls) -> "_Epsilon":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self) -> str:
+        return "Epsilon"
+
+    def __copy__(self) -> "_Epsilon":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_Epsilon":
+        return self
 
     def __repr__(self) -> str:
         return "ε"
@@ -27,6 +47,37 @@ def sym_sort_key(s: Any) -> tuple[int, str]:
     return (0, s) if isinstance(s, str) else (1, "")
 
 
+def _freeze_edges(
+    by_src: Dict[str, Dict[str, Any]], *, ordered: bool = False
+) -> Mapping[str, Mapping[str, Tuple[Any, ...]]]:
+    """
+    Finish an edges build: by_src[src][dst] holds the labels of src -> dst as
+    a list, which is sorted and swapped for a tuple inside the same dicts,
+    and every level is wrapped read-only. The order is the one sym_sort_key
+    gives (strings lexicographically, then ε) but without the decorated
+    sort: plain strings sort natively and ε, at most one per (src, dst), is
+    moved to the tail. Builders that appended labels in that order already
+    pass `ordered=True` to skip the sorting.
+
+    Equal label tuples are shared: most edges carry one of a few label sets
+    (a single symbol, ε, a prefix of Σ), so one tuple object serves them all.
+    """
+    shared: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+    for src, out in by_src.items():
+        for d, syms in out.items():
+            if not ordered:
+                if Epsilon in syms:
+                    syms.remove(Epsilon)
+                    syms.sort()
+                    syms.append(Epsilon)
+                else:
+                    syms.sort()
+            labels = tuple(syms)
+            out[d] = shared.setdefault(labels, labels)
+        by_src[src] = MappingProxyType(out)  # type: ignore[assignment]
+    return MappingProxyType(by_src)
+
+
 SymT = TypeVar("SymT", bound=Hashable)  # symbol type
 DstT = TypeVar("DstT")  # destination payload type
 
@@ -39,57 +90,148 @@ class Automaton(Generic[SymT, DstT], ABC):
     q0: str
     F: frozenset[str]
 
-    _edges: Mapping[str, Mapping[str, Tuple[SymT, ...]]
-                    ] = field(init=False, repr=False)
     __hash__ = object.__hash__
 
-    def _generate_edges(self):
-        by_src: Dict[str, Dict[str, List[SymT]]] = {}
-        for (src, sym), dst in self.δ.items():
-            if isinstance(dst, (set, frozenset)):
-                for d in dst:  # type: ignore[union-attr]
-                    by_src.setdefault(src, {}).setdefault(d, []).append(  # type: ignore[union-attr]
-                        sym
-                    )
+    @cached_property
+    def _edges(self) -> Mapping[str, Mapping[str, Tuple[SymT, ...]]]:
+        # built on first access: many automata (intermediate results of the
+        # operations, minimize inputs) are never asked for their edges
+        return self._generate_edges()
+
+    # Id view shared by the subclasses' dense and bitmask tables: states are
+    # numbered in sorted order, and a set of states is an int with bit i set
+    # iff state i is in it.
+
+    @cached_property
+    def _state_ids(self) -> Mapping[str, int]:
+        return MappingProxyType({q: i for i, q in enumerate(sorted(self.Q))})
+
+    @cached_property
+    def _state_names(self) -> Tuple[str, ...]:
+        """Inverse of `_state_ids`: _state_names[i] is the state with id i."""
+        return tuple(self._state_ids)
+
+    @cached_property
+    def _succ_masks(self) -> Tuple[int, ...]:
+        """_succ_masks[i] = bitmask of the states one transition (any symbol, ε too) from state i."""
+        ids = self._state_ids
+        succs = [0] * len(ids)
+        for (src, _), dst in self.δ.items():
+            i = ids[src]
+            if isinstance(dst, str):
+                succs[i] |= 1 << ids[dst]
             else:
-                by_src.setdefault(src, {}).setdefault(dst, []).append(  # type: ignore[union-attr]
-                    sym
-                )
-
-        # freeze, sort symbols, and wrap read-only
-        frozen: Dict[str, MappingProxyType[str, Tuple[SymT, ...]]] = {}
-        for src, dst_map in by_src.items():
-            inner: Dict[str, Tuple[SymT, ...]] = {
-                dst: tuple(sorted(syms, key=sym_sort_key))
-                for dst, syms in dst_map.items()
-            }
-            frozen[src] = MappingProxyType(inner)
-        object.__setattr__(self, "_edges", MappingProxyType(frozen))
+                for d in dst:  # type: ignore[attr-defined]
+                    succs[i] |= 1 << ids[d]
+        return tuple(succs)
+
+    @cached_property
+    def _pred_masks(self) -> Tuple[int, ...]:
+        """
+        Reverse adjacency: _pred_masks[j] = bitmask of the states with a
+        transition into state j. Cached with the automaton, so every
+        backward search over it (dead states, minimize, sampling) shares it.
+        """
+        preds = [0] * len(self._succ_masks)
+        for i, m in enumerate(self._succ_masks):
+            bit = 1 << i
+            for j in bit_indices(m):
+                preds[j] |= bit
+        return tuple(preds)
+
+    @cached_property
+    def _dead_end_states(self) -> frozenset[str]:
+        """States with no path of at least one edge into F."""
+        # one backward sweep over the predecessor masks, seeded with the
+        # predecessors of F
+        ids = self._state_ids
+        preds = self._pred_masks
+        start = 0
+        for f in self.F:
+            start |= preds[ids[f]]
+
+        live = mask_closure(start, preds)
+        return frozenset(q for q, i in ids.items() if not live >> i & 1)
+
+    @cached_property
+    def _sample_successors(self) -> List[Optional[List[str]]]:
+        """Per state id, the successor list the Sampler expands (None until first needed)."""
+        return [None] * len(self._state_ids)
+
+    def _generate_edges(self) -> Mapping[str, Mapping[str, Tuple[SymT, ...]]]:
+        # one scan of δ appends each label to its (src, dst) list; the freeze
+        # pass then swaps the lists for tuples in the same dicts
+        by_src: Dict[str, Dict[str, Any]] = {}
+        for (src, sym), dst in self.δ.items():
+            if not dst:
+                # an empty row adds no edge, so it must not add its source
+                continue
+            out = by_src.get(src)
+            if out is None:
+                out = by_src[src] = {}
+            for d in ((dst,) if isinstance(dst, str) else dst):  # type: ignore[attr-defined]
+                syms = out.get(d)
+                if syms is None:
+                    out[d] = [sym]
+                else:
+                    syms.append(sym)
+
+        return _freeze_edges(by_src)
 
     def _freeze_variables(self):
-        object.__setattr__(self, "Q", frozenset(self.Q))
-        object.__setattr__(self, "Σ", frozenset(self.Σ))
-        object.__setattr__(self, "F", frozenset(self.F))
+        # names are interned once here so every later δ / edges lookup
+        # compares by identity and reuses the cached string hash
+        intern = sys.intern
+        object.__setattr__(self, "Q", frozenset(map(intern, self.Q)))
+        object.__setattr__(self, "Σ", frozenset(map(intern, self.Σ)))
+        object.__setattr__(self, "F", frozenset(map(intern, self.F)))
+        object.__setattr__(self, "q0", intern(self.q0))
 
-        if not isinstance(self.δ, MappingProxyType):
-            object.__setattr__(self, "δ", MappingProxyType(dict(self.δ)))
+        δ: Dict[tuple[str, SymT], DstT] = {}
+        # equal destination sets are frozen once and shared between keys
+        frozen: Dict[frozenset[str], frozenset[str]] = {}
+        for (src, sym), dst in self.δ.items():
+            if isinstance(sym, str):
+                sym = intern(sym)  # type: ignore[assignment]
+            if isinstance(dst, str):
+                dst = intern(dst)  # type: ignore[assignment]
+            else:
+                # any destination collection (set, list, tuple, ...) is
+                # stored as a frozenset, so rows are hashable as they are
+                key = frozenset(dst)
+                shared = frozen.get(key)
+                if shared is None:
+                    # sets that are already frozen over interned names
+                    # (e.g. taken from another automaton) are kept as is
+                    if key is dst and all(intern(d) is d for d in key):
+                        shared = frozen[key] = key
+                    else:
+                        shared = frozen[key] = frozenset(map(intern, key))
+                dst = shared  # type: ignore[assignment]
+            δ[(intern(src), sym)] = dst
+        object.__setattr__(self, "δ", MappingProxyType(δ))
 
     def __post_init__(self):
         self._freeze_variables()
-        self._generate_edges()
+
+    @cached_property
+    def _content_key(self) -> Tuple[Any, ...]:
+        """Hashable key equal for automata with identical Q, Σ, δ, q0 and F."""
+        return (self.Q, self.Σ, frozenset(self.δ.items()), self.q0, self.F)
 
     def get_automaton_type(self) -> str:
         return str(self.__class__.__name__)
 
     @abstractmethod
-    def _transition_impl(self, state: str, symbol: str) -> str | set[str]:
+    def _transition_impl(self, state: str, symbol: str) -> str | frozenset[str]:
         pass
 
     @lru_cache(maxsize=None)
-    def _transition_cached(self, state: str, symbol: str) -> str | set[str]:
+    def _transition_cached(self, state: str, symbol: str) -> str | frozenset[str]:
+        # cached results are shared between callers, so they must be immutable
         return self._transition_impl(state, symbol)
 
-    def transition(self, state: str, symbol: str) -> str | set[str]:
+    def transition(self, state: str, symbol: str) -> str | set[str] | frozenset[str]:
         return self._transition_cached(state, symbol)
 
     @property
@@ -1,8 +1,16 @@
+import textwrap
+from array import array
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import List, Mapping, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
 
 from automata.automaton import Automaton
+from automata.utils import bit_indices, mask_closure
+
+
+# alphabets up to this size get an unrolled if/elif dispatch in compile()
+_UNROLL_MAX_SYMBOLS = 4
 
 
 @dataclass(frozen=True, eq=False)
@@ -10,12 +18,16 @@ class DFA(Automaton[str, str]):
     def __post_init__(self):
         super().__post_init__()
 
-        # make sure DFA transition function is total
-        for state in self.Q:
-            for symbol in self.Σ:
-                if (state, symbol) not in self.δ:
-                    raise ValueError(
-                        f"Transition function is not total: missing ({state}, {symbol})")
+        # make sure DFA transition function is total: δ is total iff it has
+        # exactly one key per (state, symbol) cell, so count in one pass over
+        # δ and only search for the missing pair when the count falls short
+        Q, Σ = self.Q, self.Σ
+        covered = sum(1 for state, symbol in self.δ if state in Q and symbol in Σ)
+        if covered != len(Q) * len(Σ):
+            state, symbol = next(
+                (q, a) for q in sorted(Q) for a in sorted(Σ) if (q, a) not in self.δ)
+            raise ValueError(
+                f"Transition function is not total: missing ({state}, {symbol})")
 
     def get_tuples(
         self,
@@ -33,21 +45,266 @@ class DFA(Automaton[str, str]):
         return self._edges
 
     def _transition_impl(self, state: str, symbol: str) -> str:
-        if (state, symbol) not in self.δ:
-            raise ValueError(f"No transition defined for ({state}, {symbol})")
-        return self.δ[(state, symbol)]
+        # one subscript: the read-only proxy forwards it straight to the dict
+        try:
+            return self.δ[(state, symbol)]
+        except KeyError:
+            raise ValueError(
+                f"No transition defined for ({state}, {symbol})") from None
 
     def transition(self, state: str, symbol: str) -> str:
-        return str(super().transition(state, symbol))
+        return self._transition_cached(state, symbol)  # type: ignore[return-value]
 
     def accepts(self, word: str) -> bool:
-        state = self.q0
-        for sym in word:
-            if sym not in self.Σ:
-                raise ValueError(
-                    f"Symbol {sym!r} not in alphabet Σ = {self.Σ}")
-            state = self.transition(state, sym)
-        return state in self.F
+        # the per-character loop runs inside the generated acceptor, which is
+        # built on first use and cached for every later call
+        return self.compile()(word)
+
+    def compile(self) -> Callable[[str], bool]:
+        """
+        Build an acceptor specialized to this DFA.
+
+        The transition table is inlined into generated source as a
+        tuple-of-tuples constant (rows = states, columns = symbols), so the
+        returned function runs on plain integer indexing instead of δ lookups.
+        Only states reachable from q0 that can still reach F get a row; every
+        other state collapses into a single trap (-1) that ends the run early.
+        The result is cached per DFA; it behaves exactly like `accepts`.
+        """
+        return self._acceptor
+
+    @cached_property
+    def _acceptor(self) -> Callable[[str], bool]:
+        # stored on the instance, so it is dropped together with the DFA
+        Σ_sorted = sorted(self.Σ)
+        aid = {a: i for i, a in enumerate(Σ_sorted)}
+
+        # live part from the cached id views: reachable from q0 (successor
+        # masks) and able to reach F (predecessor masks), with no δ lookups
+        ids = self._state_ids
+        F_mask = 0
+        for f in self.F:
+            F_mask |= 1 << ids[f]
+        alive = (mask_closure(1 << ids[self.q0], self._succ_masks)
+                 & mask_closure(F_mask, self._pred_masks))
+
+        # dense ids over the live states, trap = -1; rows are the cached
+        # _trans rows renumbered
+        keep = list(bit_indices(alive))
+        sid = [-1] * len(ids)
+        for new, i in enumerate(keep):
+            sid[i] = new
+        trans = self._trans
+        table = tuple(tuple(sid[t] for t in trans[i]) for i in keep)
+        # accepting ids as one int bitmask: the final check is a bit test
+        finals = 0
+        for i in bit_indices(F_mask & alive):
+            finals |= 1 << sid[i]
+
+        invalid = 'raise ValueError(f"Symbol {c!r} not in alphabet Σ = {SIGMA}")'
+        start = sid[ids[self.q0]]
+
+        if len(Σ_sorted) > _UNROLL_MAX_SYMBOLS and all(
+                len(a) == 1 and ord(a) < 255 for a in Σ_sorted):
+            # single-char latin-1 alphabet: the whole word is mapped to
+            # symbol ids by one bytes.translate, and the loop walks the bytes
+            tab = bytes(aid.get(chr(i), 255) for i in range(256))
+            src = textwrap.dedent(f"""\
+                def _run(word):
+                    try:
+                        ids = word.encode("latin-1").translate({tab!r})
+                    except UnicodeEncodeError as exc:
+                        ids = word[:exc.start].encode("latin-1").translate({tab!r})
+                        ids += b"\\xff"
+                    if 255 in ids:
+                        c = word[ids.index(255)]
+                        {invalid}
+                    s = {start!r}
+                    if s >= 0:
+                        for a in ids:
+                            s = {table!r}[s][a]
+                            if s < 0:
+                                break
+                    return s >= 0 and {finals!r} >> s & 1 == 1
+                """)
+        else:
+            if 0 < len(Σ_sorted) <= _UNROLL_MAX_SYMBOLS:
+                # small alphabet: one branch per symbol, each indexing its own
+                # column constant, so there is no symbol-map lookup per character
+                step = ""
+                for j, a in enumerate(Σ_sorted):
+                    column = tuple(row[j] for row in table)
+                    step += f"{'if' if j == 0 else 'elif'} c == {a!r}:\n"
+                    step += f"    s = {column!r}[s]\n"
+                step += f"else:\n    {invalid}\n"
+            else:
+                step = textwrap.dedent(f"""\
+                    a = A.get(c)
+                    if a is None:
+                        {invalid}
+                    s = {table!r}[s][a]
+                    """)
+
+            src = textwrap.dedent(f"""\
+                def _run(word):
+                    s = {start!r}
+                    it = iter(word)
+                    if s >= 0:
+                        for c in it:
+                __STEP__
+                            if s < 0:
+                                break
+                    # only reached with input left once the run hit the trap
+                    for c in it:
+                        if c not in A:
+                            {invalid}
+                    return s >= 0 and {finals!r} >> s & 1 == 1
+                """).replace("__STEP__\n", textwrap.indent(step, " " * 12))
+
+        # the symbol map stays a global so it isn't rebuilt per call
+        namespace: Dict[str, Any] = {"A": aid, "SIGMA": self.Σ}
+        exec(src, namespace)
+        return namespace["_run"]  # type: ignore[no-any-return]
+
+    # Dense view: states are numbered in sorted order and symbols in sorted
+    # order, so _trans[i][j] is the id of δ(state i, symbol j). Loops that run
+    # over every state for several steps index these tuples instead of
+    # hashing (state, symbol) pairs.
+    @cached_property
+    def _trans(self) -> Tuple[Tuple[int, ...], ...]:
+        ids = self._state_ids
+        δ = self.δ
+        Σ_sorted = sorted(self.Σ)
+        return tuple(
+            tuple(ids[δ[(q, a)]] for a in Σ_sorted) for q in ids
+        )
+
+    @cached_property
+    def _inv_csr(self) -> Tuple[Tuple[array, array], ...]:
+        """
+        Inverse of `_trans` in CSR form, one (indptr, indices) pair of
+        array('i') buffers per symbol id: the states entering state t on
+        symbol j are indices[indptr[t]:indptr[t + 1]], in ascending order.
+        """
+        trans = self._trans
+        n = len(trans)
+        csr = []
+        for j in range(len(self.Σ)):
+            indptr = array("i", bytes(4 * (n + 1)))
+            for row in trans:
+                indptr[row[j] + 1] += 1
+            for t in range(n):
+                indptr[t + 1] += indptr[t]
+            fill = indptr[:-1]
+            indices = array("i", bytes(4 * n))
+            for i, row in enumerate(trans):
+                t = row[j]
+                indices[fill[t]] = i
+                fill[t] += 1
+            csr.append((indptr, indices))
+        return tuple(csr)
+
+    @cached_property
+    def _word_counts(self) -> List[List[int]]:
+        # _word_counts[k][i] = number of words of length k accepted from
+        # state i; further lengths are appended on demand by _counts_of_length
+        return [[int(q in self.F) for q in self._state_ids]]
+
+    def _counts_of_length(self, k: int) -> List[int]:
+        levels = self._word_counts
+        trans = self._trans
+        while len(levels) <= k:
+            prev = levels[-1]
+            levels.append([sum(prev[t] for t in row) for row in trans])
+        return levels[k]
+
+    def count_strings_of_length(self, k: int) -> int:
+        """Number of accepted words of length exactly k."""
+        if k < 0:
+            raise ValueError(f"Length must be non-negative, got {k}.")
+        return self._counts_of_length(k)[self._state_ids[self.q0]]
+
+    def words_of_length(self, k: int) -> Iterator[str]:
+        """
+        Yield every accepted word of length exactly k in lexicographic order.
+
+        Branches are pruned with the per-length counts, so each step leads
+        to at least one word and the cost grows with the output rather than
+        with |Σ|^k.
+        """
+        if k < 0:
+            raise ValueError(f"Length must be non-negative, got {k}.")
+        levels = [self._counts_of_length(r) for r in range(k + 1)]
+        start = self._state_ids[self.q0]
+        if not levels[k][start]:
+            return
+        if k == 0:
+            yield ""
+            return
+
+        Σ_sorted = sorted(self.Σ)
+        trans = self._trans
+        # stack[i] iterates the candidates for letter i; letters holds the
+        # letters chosen above the top of the stack
+        stack = [iter(zip(Σ_sorted, trans[start]))]
+        letters: List[str] = []
+        while stack:
+            counts = levels[k - len(stack)]
+            for a, t in stack[-1]:
+                if counts[t]:
+                    break
+            else:
+                stack.pop()
+                if letters:
+                    letters.pop()
+                continue
+            letters.append(a)
+            if len(letters) == k:
+                yield "".join(letters)
+                letters.pop()
+            else:
+                stack.append(iter(zip(Σ_sorted, trans[t])))
+
+    def nth_string(self, n: int) -> str:
+        """
+        Return the n-th accepted word (0-based) in shortlex order, i.e. sorted
+        by (len, lex) like the Sampler. Words are located by navigating the
+        per-length counts, so no prefixes are enumerated.
+
+        Raises:
+            IndexError: if the language has at most n words.
+        """
+        if n < 0:
+            raise IndexError(f"Index must be non-negative, got {n}.")
+
+        # an infinite language always has a word with length in [|Q|, 2|Q|)
+        finite = not any(
+            self.count_strings_of_length(k)
+            for k in range(len(self.Q), 2 * len(self.Q))
+        )
+
+        k = 0
+        while n >= (c := self.count_strings_of_length(k)):
+            n -= c
+            k += 1
+            if finite and k >= len(self.Q):
+                raise IndexError("Index out of range for this language.")
+
+        Σ_sorted = sorted(self.Σ)
+        trans = self._trans
+        state = self._state_ids[self.q0]
+        letters: List[str] = []
+        for remaining in range(k - 1, -1, -1):
+            counts = self._counts_of_length(remaining)
+            for a, t in zip(Σ_sorted, trans[state]):
+                c = counts[t]
+                if n < c:
+                    letters.append(a)
+                    state = t
+                    break
+                n -= c
+
+        return "".join(letters)
 
     def formatted_transition(self, state: str, symbol: str) -> str:
         return self.δ.get((state, symbol), "-")
@@ -84,27 +341,21 @@ class DFA(Automaton[str, str]):
     def save(self, out_base: str) -> Path:
         sorted_Q = sorted(self.Q)
         sorted_Σ = sorted(self.Σ)
+        index = {q: str(i) for i, q in enumerate(sorted_Q)}
 
-        states = f"{len(self.Q)} [{', '.join(sorted_Q)}]"
-        alphabet = f"{len(self.Σ)} [{', '.join(sorted_Σ)}]"
-        transitions: List[str] = []
-
-        for src in sorted(self.Q):
-            transition_row: List[str] = []
-            for sym in sorted(self.Σ):
-                dst = self.δ.get((src, sym))
-                transition_row.append(str(sorted_Q.index(dst)) if dst else "")
+        lines = [
+            f"{len(self.Q)} [{', '.join(sorted_Q)}]",
+            f"{len(self.Σ)} [{', '.join(sorted_Σ)}]",
+        ]
 
-            transitions.append(", ".join(transition_row))
+        for src in sorted_Q:
+            lines.append(", ".join(
+                index.get(self.δ.get((src, sym), ""), "") for sym in sorted_Σ))
 
-        lines = [states, alphabet] + transitions + [
-            str(sorted_Q.index(self.q0)),
-            f"{', '.join(sorted(str(sorted_Q.index(f)) for f in self.F))}"
-        ]
+        lines.append(index[self.q0])
+        lines.append(", ".join(sorted(index[f] for f in self.F)))
 
         path_obj = Path(f"{out_base}.dfauto")
-
-        with open(path_obj, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        path_obj.write_text("\n".join(lines), encoding="utf-8")
 
         return path_obj
@@ -1,17 +1,11 @@
 
-from typing import Any, Dict, FrozenSet, Set, Tuple, overload
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Set, Tuple, TypeVar, overload
 from automata.automaton import Epsilon, Symbol
 from automata.dfa import DFA
 from automata.nfa import NFA
-
-
-class _MinimizationView:
-    def __init__(self, auto: DFA | NFA, live: frozenset[str]):
-        self.Q = frozenset(live)
-        self.Σ = auto.Σ
-        self.q0 = auto.q0
-        self.F = frozenset(s for s in auto.F if s in live)
-        self.δ = {k: v for k, v in auto.δ.items() if k[0] in live}
+from automata.utils import bit_indices, mask_closure, mask_flags
 
 
 def _fresh_sink_name(existing_states: Set[str]) -> str:
@@ -23,152 +17,401 @@ def _fresh_sink_name(existing_states: Set[str]) -> str:
         i += 1
 
 
-def find_dead_states(auto: DFA | NFA) -> set[str]:
-    visited: set[str] = set()
-    useful: set[str] = set()
-
-    def rec(state: str) -> bool:
-        if state in visited:
-            return state in useful
-
-        visited.add(state)
-
-        is_useful = False
+def _live_mask(auto: DFA | NFA) -> int:
+    """
+    Bitmask of the state ids reachable from q0 that can also reach F: the
+    forward and backward searches meet in one int, so callers get the
+    trimmed state set before any grouping starts.
+    """
+    # the automaton caches its successor and predecessor masks, so each
+    # search is a frontier sweep of big-int ORs over shared tables
+    ids = auto._state_ids
+    F_mask = 0
+    for f in auto.F:
+        F_mask |= 1 << ids[f]
 
-        if state in auto.F:
-            useful.add(state)
-            is_useful = True
+    return (mask_closure(1 << ids[auto.q0], auto._succ_masks)
+            & mask_closure(F_mask, auto._pred_masks))
 
-        for ns in auto.edges.get(state, {}):
-            if rec(ns):
-                useful.add(state)
-                is_useful = True
 
-        return is_useful
+def _live_flags(auto: DFA | NFA) -> bytearray:
+    """live[i] == 1 iff state id i is set in `_live_mask`."""
+    return mask_flags(_live_mask(auto), len(auto._state_ids))
 
-    rec(auto.q0)
 
-    return set(state for state in auto.Q if state not in useful)
+def find_dead_states(auto: DFA | NFA) -> set[str]:
+    """States that are unreachable from q0 or cannot reach F."""
+    # set algebra stays on ints; only the dead bits are decoded to names
+    dead = ((1 << len(auto._state_ids)) - 1) & ~_live_mask(auto)
+    names = auto._state_names
+    return {names[i] for i in bit_indices(dead)}
 
 
-def group_indistinguishable_states(auto: DFA | NFA | _MinimizationView) -> Set[FrozenSet[str]]:
+def group_indistinguishable_states(auto: DFA | NFA) -> Set[FrozenSet[str]]:
     """
     Group states by identical outgoing-transition 'rows' (including ε for NFAs).
     Returns a set of frozensets; each frozenset is one equivalence class.
 
     Note: This ONLY compares transition structure, not acceptance (F).
     """
-    # Build a signature per state representing its transition row
-    def row_signature(state: str) -> Tuple[Tuple[Any, Any], ...]:
-        if isinstance(auto, NFA):
-            # include ε alongside Σ
-            syms = list(auto.Σ) + [Epsilon]
-            # each destination is a set -> freeze for hashing
-            pairs = tuple((sym, frozenset(auto.δ.get((state, sym), set())))
-                          for sym in syms)
-        else:
-            syms = list(auto.Σ)
-            pairs = tuple((sym, frozenset(auto.δ.get((state, sym), set())))
-                          for sym in syms)
-        # sort for deterministic grouping
-        return tuple(sorted(pairs, key=lambda x: (str(x[0]), str(x[1]))))
-
-    buckets: Dict[Tuple[Tuple[str, Any], ...], Set[str]] = {}
-    for s in auto.Q - auto.F:
-        sig = row_signature(s)
-        buckets.setdefault(sig, set()).add(s)
-
-    groups = {frozenset(g) for g in buckets.values()}
-    buckets.clear()
-
-    for s in auto.F:
-        sig = row_signature(s)
-        buckets.setdefault(sig, set()).add(s)
-
-    groups.update({frozenset(g) for g in buckets.values()})
-    return groups
+    # Fix the symbol order once so a state's row is just its destinations in
+    # that order; acceptance goes into the key, so one bucketing pass over Q
+    # keeps accepting and non-accepting states apart.
+    if isinstance(auto, NFA):
+        # include ε alongside Σ; the NFA's cached bitmask rows already hold
+        # every δ(state, sym) as an int, so a row is a tuple of ints
+        ids = auto._state_ids
+        masks = [auto._delta_masks[sym] for sym in [*sorted(auto.Σ), Epsilon]]
 
+        def row_signature(state: str) -> Tuple[Any, ...]:
+            i = ids[state]
+            return tuple(rows[i] for rows in masks)
+    else:
+        # a DFA's cached id rows are already per-state tuples in sorted-Σ
+        # order: the signature is the row itself, nothing is rebuilt
+        dfa_ids = auto._state_ids
+        trans = auto._trans
 
-@overload
-def minimize(auto: "DFA") -> "DFA": ...
-@overload
-def minimize(auto: "NFA") -> "NFA": ...
+        def row_signature(state: str) -> Tuple[Any, ...]:
+            return trans[dfa_ids[state]]
 
+    F = auto.F
+    buckets: Dict[Tuple[bool, Tuple[Any, ...]], Set[str]] = {}
+    for s in auto.Q:
+        buckets.setdefault((s in F, row_signature(s)), set()).add(s)
 
-def minimize(auto: DFA | NFA) -> DFA | NFA:
-    dead = find_dead_states(auto)
-    live = (auto.Q - dead) | {auto.q0}
+    return {frozenset(g) for g in buckets.values()}
 
-    view = _MinimizationView(auto, live)
-    groups = group_indistinguishable_states(view)
 
-    new_Q: set[str] = set()
-    state_map: Dict[str, str] = {}
-    rep_of: Dict[str, str] = {}
+_A = TypeVar("_A", DFA, NFA)
 
-    for g in groups:
-        kept = view.q0 if view.q0 in g else sorted(g)[0]
-        for s in g:
-            state_map[s] = kept
-        new_Q.add(kept)
-        rep_of[kept] = next(iter(g))
 
-    if isinstance(auto, NFA):
-        new_δ_nfa: Dict[Tuple[str, Symbol], frozenset[str]] = {}
+def _settled(result: _A, distinct_rows: bool) -> _A:
+    # marks a result that another pass would return unchanged: every kept
+    # state is live and no two of them share acceptance and a remapped row
+    if distinct_rows:
+        object.__setattr__(result, "_settled", True)
+    return result
 
-        for (src, sym), dsts in view.δ.items():
-            if src not in live:
-                continue
 
-            kept_src = state_map.get(src)
-            if kept_src not in new_Q:
-                continue
+def _accepting(auto: DFA | NFA) -> bytes:
+    """
+    final[i] == 1 iff state id i is accepting: the accepting / non-accepting
+    split as one byte per id, filled by a single C-level map over the states.
+    """
+    return bytes(map(auto.F.__contains__, auto._state_ids))
 
-            mapped = frozenset(
-                state_map[d] for d in dsts
-                if d in live and state_map[d] in new_Q
-            )
-            if mapped:
-                new_δ_nfa[(kept_src, sym)] = mapped
-
-        return NFA(
-            Q=frozenset(new_Q),
-            Σ=view.Σ,
-            δ=new_δ_nfa,
-            q0=view.q0,
-            F=frozenset(state_map[s] for s in view.F if state_map[s] in new_Q),
-        )
-
-    new_δ_dfa: Dict[Tuple[str, str], str] = {}
-
-    # cover every (kept_src, sym) from a representative in the original δ
-    for kept_src in new_Q:
-        rep_src = rep_of[kept_src]
-        for sym in view.Σ:
-            orig_dst = auto.δ.get((rep_src, sym))
-            if orig_dst is None:
-                continue  # will fix via sink below
-            # If destination is not live, it was pruned; fix via sink
-            if orig_dst not in live:
+
+def _blocks(
+    live: bytearray, key: Callable[[int], Hashable], q0: int
+) -> Tuple[array, List[int]]:
+    """
+    Partition the live state ids (q0 among them) by `key` into a flat
+    block-id vector: kept_of[i] is the id standing in for state i (-1 if
+    not live), and `kept` has one id per block — q0 if the block holds it,
+    else the smallest id, i.e. the lexicographically smallest name.
+    """
+    block_ids: Dict[Hashable, int] = {}
+    block_of = array("i", [-1]) * len(live)
+    # ids are visited in ascending order, so a block's first member is its
+    # smallest one: the representative is fixed on creation, never searched
+    rep = array("i")
+    for i, alive in enumerate(live):
+        if alive:
+            b = block_ids.setdefault(key(i), len(rep))
+            if b == len(rep):
+                rep.append(i)
+            block_of[i] = b
+    rep[block_of[q0]] = q0
+
+    kept_of = array("i", (rep[b] if b >= 0 else -1 for b in block_of))
+    return kept_of, rep.tolist()
+
+
+def _hopcroft_blocks(dfa: DFA, final: bytes, live: bytearray) -> Tuple[List[int], int]:
+    """
+    Myhill–Nerode classes of the live part of a DFA by Hopcroft's partition
+    refinement: block_of[i] is the class of live state id i (-1 otherwise).
+    Transitions into pruned states lead to one implicit sink, id n, whose
+    class is returned too; a live state shares it only if it cannot reach F
+    (which only a forced-live q0 can).
+    """
+    trans = dfa._trans
+    n = len(live)
+    k = len(dfa.Σ)
+    sink = n
+    nodes = [i for i, alive in enumerate(live) if alive] + [sink]
+
+    # predecessors come from the DFA's cached inverse; pruned sources are
+    # skipped while splitting (their block is -1). Only the sink's
+    # predecessors, live states entering a pruned one, are collected here
+    inv = dfa._inv_csr
+    sink_pre: List[List[int]] = [[] for _ in range(k)]
+    for i in nodes[:-1]:
+        for a, d in enumerate(trans[i]):
+            if not live[d]:
+                sink_pre[a].append(i)
+    for a in range(k):
+        sink_pre[a].append(sink)
+
+    # has_in[a][q] == 1 iff node q is entered on a at all: splitting on
+    # (C, a) only looks at those members of C. Sparse symbols (most states
+    # sending a to one trap) then skip nearly all of C
+    has_in: List[bytes] = []
+    for indptr, _ in inv:
+        has_in.append(bytes(map(int.__ne__, indptr[1:], indptr[:-1])) + b"\x01")
+
+    # refinable partition over flat int arrays: elems lists the nodes block
+    # by block, block b owning elems[first[b]:end[b]]; loc is the inverse of
+    # elems and block_of maps node -> block (-1 for pruned states). Members
+    # marked during a split are swapped to the front of their block, up to
+    # mid[b], so splitting only moves a boundary
+    accepting = [i for i in nodes[:-1] if final[i]]
+    rejecting = [i for i in nodes if i == sink or not final[i]]
+    elems = array("i", accepting + rejecting)
+    loc = array("i", bytes(4 * (n + 1)))
+    for x, i in enumerate(elems):
+        loc[i] = x
+    first: List[int] = []
+    end: List[int] = []
+    block_of = array("i", [-1]) * (n + 1)
+    for members in (accepting, rejecting):
+        if members:
+            b = len(first)
+            lo = end[-1] if end else 0
+            first.append(lo)
+            end.append(lo + len(members))
+            for i in members:
+                block_of[i] = b
+    mid = first[:]
+
+    # splitters (block, symbol), with a flag per pair so membership is O(1)
+    waiting: deque[Tuple[int, int]] = deque()
+    queued: List[bytearray] = [bytearray(k) for _ in first]
+    if len(first) == 2:
+        smaller = 0 if end[0] - first[0] <= end[1] - first[1] else 1
+        for a in range(k):
+            waiting.append((smaller, a))
+            queued[smaller][a] = 1
+
+    while waiting:
+        c, a = waiting.popleft()
+        queued[c][a] = 0
+
+        # mark the members of each block that enter C on a; the slice is a
+        # copy, since C itself may be reordered by the marking
+        touched: List[int] = []
+        indptr, indices = inv[a]
+        has = has_in[a]
+        for q in elems[first[c]:end[c]]:
+            if not has[q]:
+                continue
+            entering = (sink_pre[a] if q == sink
+                        else indices[indptr[q]:indptr[q + 1]])
+            for p in entering:
+                b = block_of[p]
+                if b < 0:
+                    continue
+                m = mid[b]
+                x = loc[p]
+                if x >= m:
+                    y = elems[m]
+                    elems[x] = y
+                    loc[y] = x
+                    elems[m] = p
+                    loc[p] = m
+                    if m == first[b]:
+                        touched.append(b)
+                    mid[b] = m + 1
+
+        for b in touched:
+            m = mid[b]
+            lo = first[b]
+            if m == end[b]:
+                mid[b] = lo
                 continue
-            kept_dst = state_map[orig_dst]
-            new_δ_dfa[(kept_src, sym)] = kept_dst
-
-    if view.Σ:
-        missing = [(q, a)
-                   for q in new_Q for a in view.Σ if (q, a) not in new_δ_dfa]
-        if missing:
-            sink = _fresh_sink_name(new_Q)
-            new_Q.add(sink)
-            for a in view.Σ:
-                new_δ_dfa[(sink, a)] = sink
-            for q, a in missing:
-                new_δ_dfa[(q, a)] = sink
-
-    return DFA(
+            # the marked front becomes the new block, B keeps the rest
+            new = len(first)
+            first.append(lo)
+            end.append(m)
+            mid.append(lo)
+            queued.append(bytearray(k))
+            first[b] = mid[b] = m
+            for x in range(lo, m):
+                block_of[elems[x]] = new
+
+            # a queued splitter on B is replaced by both halves; otherwise
+            # the half with fewer states is enough. "Fewer" must count states:
+            # other notions of size lose the n log n bound
+            stay, entering = end[b] - m, m - lo
+            half = b if stay <= entering else new
+            for x in range(k):
+                if queued[b][x]:
+                    waiting.append((new, x))
+                    queued[new][x] = 1
+                else:
+                    waiting.append((half, x))
+                    queued[half][x] = 1
+
+    return block_of[:n].tolist(), block_of[sink]
+
+
+def _minimize_dfa(dfa: DFA, live: bytearray, canonical: bool = False) -> DFA:
+    """
+    DFA half of `minimize`, worked on the dense id rows of `DFA._trans`:
+    states and symbols stay ints (ids follow sorted names) until the result
+    is named, so grouping and remapping never hash (state, symbol) tuples.
+    """
+    ids = dfa._state_ids
+    names = tuple(ids)
+    trans = dfa._trans
+    syms = sorted(dfa.Σ)
+
+    final = _accepting(dfa)
+
+    # pruned targets go to one sink, named the first time a row needs it
+    sink = ""
+    key: Callable[[int], Hashable]
+    if canonical:
+        block_of, sink_block = _hopcroft_blocks(dfa, final, live)
+        if block_of[ids[dfa.q0]] == sink_block:
+            # q0 is equivalent to the sink: it is its own sink
+            sink = dfa.q0
+        key = block_of.__getitem__
+    else:
+        # same grouping as group_indistinguishable_states: acceptance plus row
+        def key(i: int) -> Hashable:
+            return (final[i], trans[i])
+    kept_of, kept_ids = _blocks(live, key, ids[dfa.q0])
+    if len(kept_ids) == len(names):
+        # every state is live and alone in its block: the DFA is already its
+        # own result, so nothing is rebuilt
+        return _settled(dfa, True)
+
+    new_Q = {names[k] for k in kept_ids}
+    new_δ: Dict[Tuple[str, str], str] = {}
+
+    # every member shares the kept state's row; the sink is closed over Σ
+    # at the end
+    rows = set()
+    for k in kept_ids:
+        src = names[k]
+        row = tuple(kept_of[d] for d in trans[k])
+        rows.add((final[k], row))
+        for a, t in zip(syms, row):
+            if t >= 0:
+                new_δ[(src, a)] = names[t]
+            else:
+                if not sink:
+                    sink = _fresh_sink_name(new_Q)
+                new_δ[(src, a)] = sink
+
+    if sink:
+        new_Q.add(sink)
+        for a in syms:
+            new_δ[(sink, a)] = sink
+
+    return _settled(DFA(
         Q=frozenset(new_Q),
-        Σ=view.Σ,
-        δ=new_δ_dfa,
-        q0=view.q0,
-        F=frozenset(state_map[s] for s in view.F if state_map[s] in new_Q),
-    )
+        Σ=dfa.Σ,
+        δ=new_δ,
+        q0=dfa.q0,
+        F=frozenset(names[kept_of[ids[f]]] for f in dfa.F if live[ids[f]]),
+    ), len(rows) == len(kept_ids))
+
+
+def _minimize_nfa(nfa: NFA, live: bytearray) -> NFA:
+    """
+    NFA half of `minimize`, worked on the cached bitmask rows of
+    `NFA._delta_masks` (one int per state and symbol, ε included).
+    """
+    ids = nfa._state_ids
+    names = nfa._state_names
+    syms: List[Symbol] = [*sorted(nfa.Σ), Epsilon]
+    masks = [nfa._delta_masks[sym] for sym in syms]
+
+    final = _accepting(nfa)
+
+    # rows over Σ and ε, as group_indistinguishable_states compares NFAs, so
+    # merged states agree on every row and the kept state's rows stand for all
+    def key(i: int) -> Hashable:
+        return (final[i], tuple(rows[i] for rows in masks))
+    kept_of, kept_ids = _blocks(live, key, ids[nfa.q0])
+    if len(kept_ids) == len(names):
+        # nothing trimmed or merged: the rows would be copied unchanged
+        return _settled(nfa, True)
+
+    # blocks as bitsets: a row keeps only live targets with one `&`, then
+    # each target bit moves to its kept state's bit; the NFA's decoded-set
+    # pool turns equal masks into one shared frozenset
+    live_mask = 0
+    kept_bit = [0] * len(names)
+    for i, k in enumerate(kept_of):
+        if k >= 0:
+            live_mask |= 1 << i
+            kept_bit[i] = 1 << k
+
+    # the same target set recurs across rows and symbols (often the empty
+    # one), so each distinct raw mask is remapped once
+    remapped: Dict[int, int] = {0: 0}
+
+    new_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {}
+    signatures = set()
+    for k in kept_ids:
+        row = []
+        for sym, rows in zip(syms, masks):
+            raw = rows[k] & live_mask
+            mapped = remapped.get(raw, -1)
+            if mapped < 0:
+                mapped = 0
+                for j in bit_indices(raw):
+                    mapped |= kept_bit[j]
+                remapped[raw] = mapped
+            if sym is Epsilon:
+                # a state merged with its ε-targets would get an ε self-loop,
+                # which moves nowhere, so it is left out
+                mapped &= ~(1 << k)
+            row.append(mapped)
+            if mapped:
+                new_δ[(names[k], sym)] = nfa._states_of(mapped)
+        signatures.add((final[k], tuple(row)))
+
+    return _settled(NFA(
+        Q=frozenset(names[k] for k in kept_ids),
+        Σ=nfa.Σ,
+        δ=new_δ,
+        q0=nfa.q0,
+        F=frozenset(names[kept_of[ids[f]]] for f in nfa.F if live[ids[f]]),
+    ), len(signatures) == len(kept_ids))
+
+
+@overload
+def minimize(auto: "DFA", *, canonical: bool = False) -> "DFA": ...
+@overload
+def minimize(auto: "NFA", *, canonical: bool = False) -> "NFA": ...
+
+
+def minimize(auto: DFA | NFA, *, canonical: bool = False) -> DFA | NFA:
+    """
+    Trim states that are unreachable or cannot reach F (q0 is always kept)
+    and merge states with the same acceptance and transition row.
+
+    With `canonical=True` a DFA is instead reduced to its Myhill–Nerode
+    classes by Hopcroft's partition refinement, giving the minimal DFA for
+    its language; that is only defined for DFAs.
+
+    When nothing would be trimmed or merged, the input itself is returned.
+    """
+    if canonical and not isinstance(auto, DFA):
+        raise ValueError("Canonical minimization is only defined for DFAs.")
+    if not canonical and getattr(auto, "_settled", False):
+        return auto
+
+    # trim first: only states live from q0 to F (plus q0 itself) are grouped
+    flags = _live_flags(auto)
+    flags[auto._state_ids[auto.q0]] = 1
+
+    # each kind has its own row representation, so pick the path once
+    if isinstance(auto, DFA):
+        return _minimize_dfa(auto, flags, canonical)
+    return _minimize_nfa(auto, flags)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from functools import lru_cache, cached_property
+from functools import cached_property
 from pathlib import Path
 from types import MappingProxyType
-from typing import Dict, List, Mapping, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Tuple
 
-from automata.automaton import Automaton, Epsilon, Symbol
+from automata.automaton import Automaton, Epsilon, Symbol, _freeze_edges
+from automata.utils import bit_indices, strongly_connected_components
 
 
 @dataclass(frozen=True, eq=False)
@@ -24,36 +25,52 @@ class NFA(Automaton[Symbol, frozenset[str]]):
     def edges(self) -> Mapping[str, Mapping[str, Tuple[Symbol, ...]]]:
         return self._edges
 
-    def _epsilon_closure_impl(
-        self, state: str, visited: Optional[set[str]] = None
-    ) -> set[str]:
-        if visited is None:
-            visited = set()
-        if state in visited:
-            return visited
-
-        visited.add(state)
-        for dst, syms in self._edges.get(state, {}).items():
-            if Epsilon in syms:
-                self._epsilon_closure_impl(dst, visited)
-        return visited
-
-    @lru_cache(maxsize=None)
-    def epsilon_closure(self, state: str) -> set[str]:
-        return self._epsilon_closure_impl(state)
-
-    def _transition_impl(self, state: str, symbol: str) -> set[str]:
-        next_states: set[str] = set()
-
-        for es in self.epsilon_closure(state):
-            next_states.update(self.δ.get((es, symbol), set()))
-            for ns in list(self.δ.get((es, symbol), set())):
-                next_states.update(self.epsilon_closure(ns))
-
-        return set(next_states)
+    @cached_property
+    def _epsilon_closures(self) -> Mapping[str, frozenset[str]]:
+        """ε-closure of every state, decoded from `_eps_masks`."""
+        return MappingProxyType({
+            q: self._states_of(mask)
+            for q, mask in zip(self._state_names, self._eps_masks)
+        })
+
+    def epsilon_closure(self, state: str) -> frozenset[str]:
+        closure = self._epsilon_closures.get(state)
+        if closure is None:
+            # a state outside Q has no ε-edges: its closure is itself
+            return frozenset((state,))
+        return closure
+
+    def _transition_impl(self, state: str, symbol: str) -> frozenset[str]:
+        # ε-closure(move(ε-closure(state), symbol)): the move rows are already
+        # closed on the target side, so one OR over the source closure is all
+        sid = self._state_ids.get(state)
+        if sid is None:
+            # a state outside Q has no rows, so it moves nowhere
+            return frozenset()
+        eps = self._eps_masks
+        sources = eps[sid]
+
+        rows = self._move_masks.get(symbol)
+        if rows is None:
+            raw = self._delta_masks.get(symbol)
+            if raw is None:
+                return frozenset()
+            # only ε gets here: it has no closed move row, so close its
+            # targets explicitly
+            moved = 0
+            for i in bit_indices(sources):
+                moved |= raw[i]
+            rows = eps
+            sources = moved
+
+        closed = 0
+        for i in bit_indices(sources):
+            closed |= rows[i]
+
+        return self._states_of(closed)
 
     def transition(self, state: str, symbol: str) -> set[str]:
-        return set(super().transition(state, symbol))
+        return set(self._transition_cached(state, symbol))  # type: ignore[arg-type]
 
     @cached_property
     def closed_edges(self) -> MappingProxyType[str, MappingProxyType[str, Tuple[str, ...]]]:
@@ -70,37 +87,150 @@ class NFA(Automaton[Symbol, frozenset[str]]):
                 }
         """
         by_src: Dict[str, Dict[str, List[str]]] = {}
-
-        for src in self.Q:
-            for sym in self.Σ:
-                # reuse your transition impl that already does ε before/after
-                dests = self.transition(src, sym)
+        names = self._state_names
+        eps = self._eps_masks
+
+        # the closures are precomputed masks, so a source's closed row on a
+        # symbol is one OR of move rows over its closure; states with the
+        # same closure share the result
+        # Σ is sorted once up front: walking the symbols in that order
+        # appends every label list already sorted
+        for sym in sorted(self.Σ):
+            move = self._move_masks[sym]
+            closed: Dict[int, int] = {}
+            for i, src_closure in enumerate(eps):
+                dests = closed.get(src_closure, -1)
+                if dests < 0:
+                    dests = 0
+                    for j in bit_indices(src_closure):
+                        dests |= move[j]
+                    closed[src_closure] = dests
                 if not dests:
                     continue
-                dst_map = by_src.setdefault(src, {})
-                for dst in dests:
-                    dst_map.setdefault(dst, []).append(sym)
+                src = names[i]
+                dst_map = by_src.get(src)
+                if dst_map is None:
+                    dst_map = by_src[src] = {}
+                for j in bit_indices(dests):
+                    syms = dst_map.get(names[j])
+                    if syms is None:
+                        dst_map[names[j]] = [sym]
+                    else:
+                        syms.append(sym)
+
+        # same freeze pass as _edges, minus the sorting
+        return _freeze_edges(by_src, ordered=True)  # type: ignore[return-value]
+
+    # Bitmask view: states are numbered in sorted order; a set of states is an int whose
+    # bit i is set iff state i is in the set.
 
-        # freeze, sort symbols, wrap read-only (same shape as _edges)
-        frozen: Dict[str, MappingProxyType[str, Tuple[str, ...]]] = {}
-        for src, dst_map in by_src.items():
-            inner = {dst: tuple(sorted(syms)) for dst, syms in dst_map.items()}
-            frozen[src] = MappingProxyType(inner)
-        return MappingProxyType(frozen)
+    @cached_property
+    def _decoded(self) -> Dict[int, frozenset[str]]:
+        # pool of decoded state sets: equal masks share one frozenset
+        return {}
+
+    def _states_of(self, mask: int) -> frozenset[str]:
+        """Inverse of `_mask_of`, pooled per mask."""
+        states = self._decoded.get(mask)
+        if states is None:
+            names = self._state_names
+            states = self._decoded[mask] = frozenset(
+                names[i] for i in bit_indices(mask))
+        return states
+
+    def _mask_of(self, states: Iterable[str]) -> int:
+        ids = self._state_ids
+        mask = 0
+        for q in states:
+            mask |= 1 << ids[q]
+        return mask
 
-    def accepts(self, word: str) -> bool:
-        pos_states = self.epsilon_closure(self.q0)
+    @cached_property
+    def _delta_masks(self) -> Mapping[Symbol, Tuple[int, ...]]:
+        """
+        _delta_masks[a][i] = bitmask of δ(state i, a), for every a in Σ ∪ {ε}.
+        One flat row per symbol indexed by state id, built in a single pass
+        over δ so later queries never hash (state, symbol) tuples.
+        """
+        ids = self._state_ids
+        rows: Dict[Symbol, List[int]] = {
+            sym: [0] * len(ids) for sym in [*self.Σ, Epsilon]
+        }
+        for (src, sym), dsts in self.δ.items():
+            row = rows.get(sym)
+            if row is not None:
+                row[ids[src]] |= self._mask_of(dsts)
+        return MappingProxyType({sym: tuple(row) for sym, row in rows.items()})
 
-        for sym in word:
-            if sym not in self.Σ:
-                raise ValueError(
-                    f"Symbol {sym!r} not in alphabet Σ = {self.Σ}")
+    @cached_property
+    def _eps_masks(self) -> Tuple[int, ...]:
+        """
+        _eps_masks[i] = bitmask of ε-closure(state i).
+
+        States in one SCC of the ε-subgraph share a closure: the SCC's members
+        plus the closures of the SCCs it points to. Tarjan hands the SCCs back
+        in reverse topological order, so those are always ready — O(V + E)
+        instead of a separate search from every state.
+        """
+        succ = [list(bit_indices(row)) for row in self._delta_masks[Epsilon]]
+        masks = [0] * len(succ)
+        for component in strongly_connected_components(succ):
+            closure = 0
+            for i in component:
+                closure |= 1 << i
+                for j in succ[i]:
+                    closure |= masks[j]
+            for i in component:
+                masks[i] = closure
+        return tuple(masks)
+
+    @cached_property
+    def _move_masks(self) -> Mapping[str, Tuple[int, ...]]:
+        """_move_masks[a][i] = bitmask of ε-closure(δ(state i, a))."""
+        eps = self._eps_masks
+        moves: Dict[str, Tuple[int, ...]] = {}
+        for sym in self.Σ:
+            row: List[int] = []
+            for raw in self._delta_masks[sym]:
+                mask = 0
+                while raw:
+                    low = raw & -raw
+                    mask |= eps[low.bit_length() - 1]
+                    raw ^= low
+                row.append(mask)
+            moves[sym] = tuple(row)
+        return MappingProxyType(moves)
+
+    @cached_property
+    def _final_mask(self) -> int:
+        return self._mask_of(self.F)
 
-            pos_states = {
-                s for prev_state in pos_states for s in self.transition(prev_state, sym)
-            }
+    def accepts(self, word: str) -> bool:
+        # the whole word is checked against Σ up front, by one C-level
+        # superset test, so the loop below only steps
+        if not self.Σ.issuperset(word):
+            sym = next(c for c in word if c not in self.Σ)
+            raise ValueError(
+                f"Symbol {sym!r} not in alphabet Σ = {self.Σ}")
+
+        moves = self._move_masks
+        # the frontier stays ε-closed: it starts closed and every move mask
+        # already includes the closure of its destinations
+        cur = self._eps_masks[self._state_ids[self.q0]]
 
-        return len(pos_states & self.F) > 0
+        for sym in word:
+            move = moves[sym]
+            nxt = 0
+            while cur:
+                low = cur & -cur
+                nxt |= move[low.bit_length() - 1]
+                cur ^= low
+            cur = nxt
+            if not cur:
+                # an empty frontier stays empty
+                return False
+
+        return cur & self._final_mask != 0
 
     def formatted_transition(self, state: str, symbol: Symbol) -> str:
         result = self.δ.get((state, symbol))
@@ -126,8 +256,17 @@ class NFA(Automaton[Symbol, frozenset[str]]):
         if self.q0 in states:
             raise ValueError("Cannot remove the start state.")
 
-        new_δ = {k: v - states for k, v in self.δ.items(
-        ) if k[0] not in states}
+        # only rows that actually point into `states` are rebuilt; the rest
+        # keep their existing frozensets, and rows left empty are dropped
+        new_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {}
+        for k, v in self.δ.items():
+            if k[0] in states:
+                continue
+            if not v.isdisjoint(states):
+                v = v - states
+                if not v:
+                    continue
+            new_δ[k] = v
 
         return type(self)(
             Q=self.Q - states,
@@ -140,28 +279,23 @@ class NFA(Automaton[Symbol, frozenset[str]]):
     def save(self, out_base: str) -> Path:
         sorted_Q = sorted(self.Q)
         sorted_Σ = sorted(self.Σ)
+        index = {q: str(i) for i, q in enumerate(sorted_Q)}
 
-        states = f"{len(self.Q)} [{', '.join(sorted_Q)}]"
-        alphabet = f"{len(self.Σ)} [{', '.join(sorted_Σ)}]"
-        transitions: List[str] = []
-
-        for src in sorted(self.Q):
-            transition_row: List[str] = []
-            for sym in sorted(self.Σ) + [Epsilon]:
-                dst = self.δ.get((src, sym))
-                transition_row.append(" ".join(sorted(str(sorted_Q.index(d))
-                                      for d in dst)) if dst else "")
+        lines = [
+            f"{len(self.Q)} [{', '.join(sorted_Q)}]",
+            f"{len(self.Σ)} [{', '.join(sorted_Σ)}]",
+        ]
 
-            transitions.append(", ".join(transition_row))
+        for src in sorted_Q:
+            lines.append(", ".join(
+                " ".join(sorted(index[d] for d in self.δ.get((src, sym), ())))
+                for sym in [*sorted_Σ, Epsilon]
+            ))
 
-        lines = [states, alphabet] + transitions + [
-            str(sorted_Q.index(self.q0)),
-            f"{', '.join(sorted(str(sorted_Q.index(f)) for f in self.F))}"
-        ]
+        lines.append(index[self.q0])
+        lines.append(", ".join(sorted(index[f] for f in self.F)))
 
         path_obj = Path(f"{out_base}.nfauto")
-
-        with open(path_obj, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        path_obj.write_text("\n".join(lines), encoding="utf-8")
 
         return path_obj
@@ -1,12 +1,78 @@
-from typing import Dict, Tuple
-from itertools import chain, combinations
-
-from automata.automaton import Epsilon, Symbol
+import sys
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from automata.automaton import Automaton, Epsilon, Symbol
 from automata.dfa import DFA
 from automata.minimization import minimize
 from automata.nfa import NFA
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# results of the operations below, keyed by operand content; None outside a
+# `result_cache()` block, so nothing is kept unless a caller asks for it
+_RESULT_CACHE: ContextVar[Optional[Dict[Tuple[Any, ...], Any]]] = ContextVar(
+    "_RESULT_CACHE", default=None
+)
+
+
+@contextmanager
+def result_cache() -> Iterator[None]:
+    """
+    Reuse operation results within the block: calling an operation again
+    with operands equal in content returns the first result. The cache is
+    dropped when the block exits.
+    """
+    token = _RESULT_CACHE.set({})
+    try:
+        yield
+    finally:
+        _RESULT_CACHE.reset(token)
+
+
+def _memoized(func: _F) -> _F:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _RESULT_CACHE.get()
+        if cache is None:
+            return func(*args, **kwargs)
+
+        key = (
+            func.__name__,
+            tuple((type(a), a._content_key) if isinstance(a, Automaton) else a
+                  for a in args),
+            tuple(sorted(kwargs.items())),
+        )
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = func(*args, **kwargs)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _prefixed(nfa: NFA, prefix: str) -> Dict[str, str]:
+    # each prefixed name is formatted and interned once per operand, then
+    # reused for Q, F, δ keys and destinations
+    return {q: sys.intern(f"{prefix}{q}") for q in nfa.Q}
+
+
+def _renamed(names: Dict[str, str], dsts: frozenset[str]) -> frozenset[str]:
+    return frozenset(names[d] for d in dsts)
+
+
+def _renamed_δ(
+    nfa: NFA, names: Dict[str, str]
+) -> Dict[Tuple[str, Symbol], frozenset[str]]:
+    # nfa's δ with every state renamed, built in one pass
+    return {(names[src], sym): _renamed(names, dsts)
+            for (src, sym), dsts in nfa.δ.items()}
+
 
+@_memoized
 def convert_dfa_to_nfa(dfa: DFA) -> NFA:
     """Convert a DFA to an equivalent NFA by wrapping its transition function.
 
@@ -29,6 +95,65 @@ def convert_dfa_to_nfa(dfa: DFA) -> NFA:
     ))
 
 
+def _empty_language_dfa(Σ: frozenset[str]) -> DFA:
+    # the minimal DFA for ∅: one rejecting state looping on every symbol
+    return DFA(
+        Q=frozenset({"q_start"}),
+        Σ=Σ,
+        δ={("q_start", symbol): "q_start" for symbol in Σ},
+        q0="q_start",
+        F=frozenset(),
+    )
+
+
+def _determinize(
+    Σ: frozenset[str],
+    moves: Mapping[str, Sequence[int]],
+    start: int,
+    F_mask: int,
+) -> DFA:
+    """Subset construction over int bitmask subsets.
+
+    Bit i of a subset stands for NFA state i. moves[a][i] is the ε-closed
+    successor mask of state i on a, so a subset's successor is the OR of its
+    members' rows. Only subsets reachable from `start` are built, breadth-first.
+    """
+    state_map: Dict[int, str] = {start: "q_start"}
+    worklist = deque([start])
+
+    dfa_delta: Dict[Tuple[str, str], str] = {}
+
+    while worklist:
+        subset = worklist.popleft()
+        name = state_map[subset]
+        for symbol, rows in moves.items():
+            next_subset = 0
+            m = subset
+            while m:
+                low = m & -m
+                next_subset |= rows[low.bit_length() - 1]
+                m ^= low
+            next_name = state_map.get(next_subset)
+            if next_name is None:
+                next_name = state_map[next_subset] = f"q_{len(state_map) - 1}"
+                worklist.append(next_subset)
+            dfa_delta[(name, symbol)] = next_name
+
+    dfa_F = frozenset(name for subset, name in state_map.items()
+                      if subset & F_mask)
+
+    dfa = DFA(
+        Q=frozenset(state_map.values()),
+        Σ=Σ,
+        δ=dfa_delta,
+        q0=state_map[start],
+        F=dfa_F
+    )
+
+    return minimize(dfa)
+
+
+@_memoized
 def convert_nfa_to_dfa(nfa: NFA) -> DFA:
     """Convert an NFA to an equivalent DFA using the subset construction method.
 
@@ -40,41 +165,60 @@ def convert_nfa_to_dfa(nfa: NFA) -> DFA:
     """
     nfa_minimized = minimize(nfa)
 
-    # power set of nfa states
-    state_subsets = [frozenset(state_subset) for state_subset in chain.from_iterable(
-        combinations(nfa_minimized.Q, r) for r in range(len(nfa_minimized.Q) + 1))]
+    # minimize keeps only accepting states reachable from q0, so no F left
+    # means the empty language
+    if not nfa_minimized.F:
+        return _empty_language_dfa(nfa_minimized.Σ)
 
-    start_states = frozenset(nfa_minimized.epsilon_closure(nfa_minimized.q0))
-    state_map: Dict[frozenset[str], str] = {
-        state: f"q_{i}" for i, state in enumerate([s for s in state_subsets if s != start_states])
-    }
-    state_map[start_states] = "q_start"
+    start = nfa_minimized._eps_masks[nfa_minimized._state_ids[nfa_minimized.q0]]
+    return _determinize(nfa_minimized.Σ, nfa_minimized._move_masks,
+                        start, nfa_minimized._final_mask)
 
-    dfa_delta: Dict[Tuple[str, str], str] = {}
 
-    for state_subset in state_map.keys():
-        for symbol in nfa_minimized.Σ:
-            next_states: set[str] = set()
-            for state in state_subset:
-                next_states.update(nfa_minimized.transition(state, symbol))
-            next_states_frozen = frozenset(next_states)
-            dfa_delta[(state_map[state_subset], symbol)
-                        ] = state_map[next_states_frozen]
+@_memoized
+def union_to_dfa(nfa1: NFA, nfa2: NFA) -> DFA:
+    """Build a minimized DFA for the union of two NFAs in one pass.
 
-    dfa_F = frozenset({state_map[s]
-                      for s in state_map.keys() if s & nfa_minimized.F})
+    Accepts the same language as convert_nfa_to_dfa(union(nfa1, nfa2)), but
+    the union NFA is never materialized: both operands' states share one
+    bitmask (nfa2's bits above nfa1's), and the subset construction runs on
+    the combined rows. The state count may differ from that route's, as
+    neither is reduced to the canonical minimal DFA.
 
-    dfa = DFA(
-        Q=frozenset(state_map.values()),
-        Σ=nfa_minimized.Σ,
-        δ=dfa_delta,
-        q0=state_map[start_states],
-        F=dfa_F
-    )
+    Args:
+        nfa1: The first NFA.
+        nfa2: The second NFA.
 
-    return minimize(dfa)
+    Returns:
+        A DFA that accepts the union of the languages of nfa1 and nfa2.
+    """
+    m1, m2 = minimize(nfa1), minimize(nfa2)
+    Σ = m1.Σ | m2.Σ
+
+    if not m1.F and not m2.F:
+        return _empty_language_dfa(Σ)
+
+    # a dead operand contributes nothing; dropping it keeps the masks narrow
+    operands = [m for m in (m1, m2) if m.F]
+
+    moves: Dict[str, List[int]] = {symbol: [] for symbol in Σ}
+    start = F_mask = shift = 0
+    for m in operands:
+        for symbol, rows in moves.items():
+            own = m._move_masks.get(symbol)
+            if own is None:
+                # symbols outside the operand's alphabet lead nowhere in it
+                rows.extend([0] * len(m.Q))
+            else:
+                rows.extend(r << shift for r in own)
+        start |= m._eps_masks[m._state_ids[m.q0]] << shift
+        F_mask |= m._final_mask << shift
+        shift += len(m.Q)
 
+    return _determinize(Σ, moves, start, F_mask)
 
+
+@_memoized
 def union(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
     """Create a new NFA that is the union of two NFAs.
 
@@ -86,23 +230,20 @@ def union(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
         An NFA that accepts the union of the languages of nfa1 and nfa2.
     """
 
-    union_Q = frozenset({f"q_start"} | {f"nfa1_{q}" for q in nfa1.Q} | {
-                        f"nfa2_{q}" for q in nfa2.Q})
+    names1 = _prefixed(nfa1, "nfa1_")
+    names2 = _prefixed(nfa2, "nfa2_")
+
+    union_Q = frozenset({"q_start", *names1.values(), *names2.values()})
     union_Σ = nfa1.Σ | nfa2.Σ
     union_q0 = "q_start"
-    union_F = frozenset({f"nfa1_{q}" for q in nfa1.F} |
-                        {f"nfa2_{q}" for q in nfa2.F})
-    union_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {}
-
-    # Epsilon transitions from new start state to both NFAs' start states
-    union_δ[(union_q0, Epsilon)] = frozenset(
-        {f"nfa1_{nfa1.q0}", f"nfa2_{nfa2.q0}"})
-
-    for (src, sym), dsts in nfa1.δ.items():
-        union_δ[(f"nfa1_{src}", sym)] = frozenset({f"nfa1_{d}" for d in dsts})
-
-    for (src, sym), dsts in nfa2.δ.items():
-        union_δ[(f"nfa2_{src}", sym)] = frozenset({f"nfa2_{d}" for d in dsts})
+    union_F = frozenset({names1[q] for q in nfa1.F} |
+                        {names2[q] for q in nfa2.F})
+    union_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {
+        # Epsilon transitions from new start state to both NFAs' start states
+        (union_q0, Epsilon): frozenset({names1[nfa1.q0], names2[nfa2.q0]}),
+        **_renamed_δ(nfa1, names1),
+        **_renamed_δ(nfa2, names2),
+    }
 
     raw_nfa = NFA(
         Q=union_Q,
@@ -115,6 +256,7 @@ def union(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
     return minimize(raw_nfa) if should_minimize else raw_nfa
 
 
+@_memoized
 def concatenate(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
     """Create a new NFA that is the concatenation of two NFAs.
 
@@ -126,25 +268,20 @@ def concatenate(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
         An NFA that accepts the concatenation of the languages of nfa1 and nfa2.
     """
 
-    concat_Q = frozenset({f"nfa1_{q}" for q in nfa1.Q} |
-                         {f"nfa2_{q}" for q in nfa2.Q})
-    concat_Σ = nfa1.Σ | nfa2.Σ
-    concat_q0 = f"nfa1_{nfa1.q0}"
-    concat_F = frozenset({f"nfa2_{q}" for q in nfa2.F})
-    concat_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {}
-
-    for (src, sym), dsts in nfa1.δ.items():
-        concat_δ[(f"nfa1_{src}", sym)] = frozenset(
-            {f"nfa1_{d}" for d in dsts})
+    names1 = _prefixed(nfa1, "nfa1_")
+    names2 = _prefixed(nfa2, "nfa2_")
 
-    for (src, sym), dsts in nfa2.δ.items():
-        concat_δ[(f"nfa2_{src}", sym)] = frozenset(
-            {f"nfa2_{d}" for d in dsts})
-
-    # Epsilon transitions from nfa1's accepting states to nfa2's start state
-    for f_state in nfa1.F:
-        concat_δ[(f"nfa1_{f_state}", Epsilon)] = frozenset(
-            {f"nfa2_{nfa2.q0}"})
+    concat_Q = frozenset({*names1.values(), *names2.values()})
+    concat_Σ = nfa1.Σ | nfa2.Σ
+    concat_q0 = names1[nfa1.q0]
+    concat_F = frozenset({names2[q] for q in nfa2.F})
+    bridge = frozenset((names2[nfa2.q0],))
+    concat_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {
+        **_renamed_δ(nfa1, names1),
+        **_renamed_δ(nfa2, names2),
+        # Epsilon transitions from nfa1's accepting states to nfa2's start state
+        **{(names1[f_state], Epsilon): bridge for f_state in nfa1.F},
+    }
 
     raw_nfa = NFA(
         Q=concat_Q,
@@ -157,6 +294,7 @@ def concatenate(nfa1: NFA, nfa2: NFA, should_minimize: bool = True) -> NFA:
     return minimize(raw_nfa) if should_minimize else raw_nfa
 
 
+@_memoized
 def kleene_star(nfa: NFA, should_minimize: bool = True) -> NFA:
     """Create a new NFA that is the Kleene star of the given NFA.
 
@@ -167,22 +305,20 @@ def kleene_star(nfa: NFA, should_minimize: bool = True) -> NFA:
         An NFA that accepts the Kleene star of the language of the input NFA.
     """
 
-    star_Q = frozenset({f"q_start"} | {f"nfa_{q}" for q in nfa.Q})
+    names = _prefixed(nfa, "nfa_")
+
+    star_Q = frozenset({"q_start", *names.values()})
     star_Σ = nfa.Σ
     star_q0 = "q_start"
-    star_F = frozenset({f"q_start"} | {f"nfa_{q}" for q in nfa.F})
-    star_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {}
-
-    # Epsilon transition from new start state to nfa's start state
-    star_δ[(star_q0, Epsilon)] = frozenset({f"nfa_{nfa.q0}"})
-
-    for (src, sym), dsts in nfa.δ.items():
-        star_δ[(f"nfa_{src}", sym)] = frozenset({f"nfa_{d}" for d in dsts})
-
-    # Epsilon transitions from nfa's accepting states back to nfa's start state
-    for f_state in nfa.F:
-        star_δ[(f"nfa_{f_state}", Epsilon)] = frozenset(
-            {f"nfa_{nfa.q0}"})
+    star_F = frozenset({"q_start"} | {names[q] for q in nfa.F})
+    back = frozenset((names[nfa.q0],))
+    star_δ: Dict[Tuple[str, Symbol], frozenset[str]] = {
+        # Epsilon transition from new start state to nfa's start state
+        (star_q0, Epsilon): back,
+        **_renamed_δ(nfa, names),
+        # Epsilon transitions from nfa's accepting states back to nfa's start state
+        **{(names[f_state], Epsilon): back for f_state in nfa.F},
+    }
 
     raw_nfa = NFA(
         Q=star_Q,
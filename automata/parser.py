@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Mapping, Tuple, Type
 from automata.automaton import Automaton, Epsilon, Symbol
 from automata.dfa import DFA
@@ -19,6 +22,21 @@ def parse_automaton(path: str) -> Automaton[Any, Any]:
     raise ValueError(f"Unknown automaton type for {path}.")
 
 
+def _read_lines(path: str) -> list[str]:
+    """
+    The lines of an automaton file, without line endings: the file is read
+    as one bytes object and decoded once. Only LF, CRLF and CR end a line, as
+    in text mode; the other separators `str.splitlines` knows (form feed,
+    NEL, U+2028, ...) stay inside their line.
+    """
+    text = Path(path).read_bytes().decode("utf-8")
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if not lines[-1]:
+        # a final line ending does not start another line
+        lines.pop()
+    return lines
+
+
 def _parse_automaton_data(lines: list[str]) -> Tuple[list[str], int, list[str] | None, list[str], str, set[str]]:
     """Parses common components for both DFA and NFA from lines."""
     if len(lines) < 4:
@@ -55,13 +73,19 @@ def _parse_automaton_data(lines: list[str]) -> Tuple[list[str], int, list[str] |
     return Q, Σ_num, Σ_raw, δ_raw, q0, F
 
 
+@lru_cache(maxsize=None)
+def _dfa_row_re(width: int) -> re.Pattern[str]:
+    """Pattern for one .dfauto transition row: `width` comma separated indices."""
+    cell = r"[ \t]*\+?[0-9]+[ \t]*"
+    return re.compile(cell + ("," + cell) * (width - 1) + r"\s*")
+
+
 def parse_dfa_file(path: str) -> DFA:
     """Parse a DFA from a .dfauto file."""
     if not path.endswith(".dfauto"):
         raise ValueError(f"Expected .dfauto file, got {path}.")
 
-    with open(path, 'r') as f:
-        lines = f.readlines()
+    lines = _read_lines(path)
 
     Q, Σ_num, Σ, _δ, q0, F = _parse_automaton_data(lines)
     if not Σ:
@@ -69,15 +93,26 @@ def parse_dfa_file(path: str) -> DFA:
 
     δ: Mapping[Tuple[str, str], str] = {}
 
+    # a well-formed row is Σ_num comma separated indices; one fullmatch per
+    # row validates its shape in C, and int() tolerates the padding
+    row_re = _dfa_row_re(Σ_num)
     for src, line in enumerate(_δ, start=0):
-        parts = [x.strip() for x in line.split(',')]
-        if len(parts) != Σ_num:
+        if Σ_num and row_re.fullmatch(line):
+            dsts = [int(x) for x in line.split(',')]
+        else:
+            parts = [x.strip() for x in line.split(',')]
+            if len(parts) != Σ_num:
+                raise ValueError(
+                    f"Transition line {src+3} has {len(parts)} items, expected {Σ_num}."
+                )
             raise ValueError(
-                f"Transition line {src+3} has {len(parts)} items, expected {Σ_num}."
-            )
-        for sym, dst_raw in enumerate(parts, start=0):
-            dst = int(dst_raw)
-            δ[(Q[src], Σ[sym])] = Q[dst]
+                f"Transition line {src+3} has an item that is not a state index: {line.strip()!r}.")
+        if max(dsts, default=0) >= len(Q):
+            raise ValueError(
+                f"Transition line {src+3} has a state index out of range 0..{len(Q)-1}.")
+        q = Q[src]
+        for sym, dst in zip(Σ, dsts):
+            δ[(q, sym)] = Q[dst]
 
     return DFA(frozenset(Q), frozenset(Σ), δ, q0, frozenset(F))
 
@@ -87,8 +122,7 @@ def parse_nfa_file(path: str) -> NFA:
     if not path.endswith(".nfauto"):
         raise ValueError(f"Expected .nfauto file, got {path}.")
 
-    with open(path, 'r') as f:
-        lines = f.readlines()
+    lines = _read_lines(path)
 
     Q, Σ_num, Σ, _δ, q0, F = _parse_automaton_data(lines)
 
@@ -108,20 +142,18 @@ def parse_nfa_file(path: str) -> NFA:
 
     δ: Mapping[Tuple[str, Symbol], frozenset[str]] = {}
     for src, line in enumerate(_δ, start=0):
-        parts = [x.strip() for x in line.split(',')]
+        parts = line.split(',')
         if len(parts) != Σ_num + 1:
             raise ValueError(
                 f"Transition line {src+3} has {len(parts)} items, expected {Σ_num} for letters and the last for ε."
             )
-        for sym, dst_raw in enumerate(parts[:-1], start=0):
-            # space seperated states
-            dsts = [Q[int(x.strip())] for x in dst_raw.split(' ') if x.strip()]
-            δ[(Q[src], Σ[sym])] = frozenset(dsts)
-
-        # Add ε transitions
-        for dst_raw in parts[-1].split(','):
-            dsts = [Q[int(x.strip())] for x in dst_raw.split(' ') if x.strip()]
-            δ[(Q[src], Epsilon)] = frozenset(dsts)
+        q = Q[src]
+        # cells hold whitespace separated state indices; split() drops the
+        # padding and empty tokens in one call, and int() ignores the rest.
+        # zip stops at the letters, leaving the last cell for ε
+        for sym, cell in zip(Σ, parts):
+            δ[(q, sym)] = frozenset([Q[int(x)] for x in cell.split()])
+        δ[(q, Epsilon)] = frozenset([Q[int(x)] for x in parts[-1].split()])
 
     return NFA(frozenset(Q), frozenset(Σ), δ, q0, frozenset(F))
 
@@ -1,15 +1,19 @@
+import heapq
 from collections import deque
 from typing import Any, List, Optional
 from automata.automaton import Automaton
 from automata.dfa import DFA
 from automata.nfa import NFA
-from automata.utils import words_for_path
+from automata.utils import bit_indices, mask_closure, mask_flags, words_for_path
 
 StatePath = List[str]
 
 
 class Sampler:
     class SampleNode:
+        # one node per queued path prefix, so the BFS allocates many of them
+        __slots__ = ("state", "prev", "depth")
+
         def __init__(self, state: str, parent: Optional["Sampler.SampleNode"] = None):
             self.state = state
             self.prev = parent
@@ -44,48 +48,92 @@ class Sampler:
         self._samples: set[str] = set()
 
     def path_between_exists(self, state: str, end_states: set[str] | frozenset[str]) -> bool:
-        def rec(state: str, visited: set[str]) -> bool:
-            if state in visited:
-                return False
-
-            for ns in self._auto.edges.get(state, {}):
-                if ns in end_states:
-                    return True
-                if rec(ns, visited | {state}):
-                    return True
-
+        # the states with a path of at least one edge into end_states are one
+        # backward sweep over the automaton's cached predecessor masks
+        auto = self._auto
+        ids = auto._state_ids
+        start = ids.get(state)
+        if start is None:
             return False
 
-        return rec(state, set())
+        preds = auto._pred_masks
+        seed = 0
+        for q in end_states:
+            if q in ids:
+                seed |= preds[ids[q]]
+
+        return mask_closure(seed, preds) >> start & 1 == 1
+
+    def _dead_end_states(self) -> frozenset[str]:
+        """States with no path of at least one edge into F (cached on the automaton)."""
+        return self._auto._dead_end_states
+
+    def _successors(self, state: str, skip: int = 0) -> List[str]:
+        """
+        Distinct next states of `state` over Σ, in state-id order, leaving
+        out the state ids set in `skip`. Two symbols leading to the same
+        state would only queue identical paths: a node's words already cover
+        every symbol along its state path.
+        """
+        auto = self._auto
+        i = auto._state_ids[state]
+        if isinstance(auto, NFA):
+            # OR the ε-closed move rows of every symbol
+            mask = 0
+            for row in auto._move_masks.values():
+                mask |= row[i]
+        else:
+            # a DFA has no ε, so its one-step successor mask is exactly this
+            mask = auto._succ_masks[i]
+        # the union is already distinct, so it only needs decoding
+        names = auto._state_names
+        return [names[j] for j in bit_indices(mask & ~skip)]
 
     def sample(self, *, max_samples: int = 10, max_depth: int = 10) -> List[str]:
-        dead_end_states: set[str] = set()
-
-        for state in self._auto.Q:
-            # checks if state can lead to accepting state
-            if not self.path_between_exists(state, self._auto.F):
-                dead_end_states.add(state)
-
-        while self._queue:
-            node = self._queue.popleft()
-
-            if node.state in self._auto.F:
-                self._samples |= node.get_possible_words(self._auto)
-
-            if len(self._samples) >= max_samples:
+        auto = self._auto
+        # per-node state tests and the successor cache are read by state id:
+        # the name is hashed once per node, not once per table
+        ids = auto._state_ids
+        n = len(ids)
+        successors = auto._sample_successors
+        F_mask = dead_mask = 0
+        for f in auto.F:
+            F_mask |= 1 << ids[f]
+        for q in self._dead_end_states():
+            dead_mask |= 1 << ids[q]
+        accepting = mask_flags(F_mask, n)
+        dead_end = mask_flags(dead_mask, n)
+        # a non-accepting dead end yields no words and is never expanded, so
+        # it is left out of the successor lists instead of being queued
+        useless = dead_mask & ~F_mask
+
+        # the loop's lookups are bound to locals once, not per node
+        queue = self._queue
+        samples = self._samples
+        Node = Sampler.SampleNode
+        while queue:
+            node = queue.popleft()
+            state = node.state
+            i = ids[state]
+
+            if accepting[i]:
+                samples |= node.get_possible_words(auto)
+
+            if len(samples) >= max_samples:
                 break
 
-            if node.state in dead_end_states:
+            if dead_end[i]:
                 continue
 
             if node.depth <= max_depth:
-                for sym in self._auto.Σ:
-                    if isinstance(self._auto, DFA):
-                        next_states = {self._auto.transition(node.state, sym)}
-                    else:
-                        next_states = self._auto.transition(node.state, sym)
+                nexts = successors[i]
+                if nexts is None:
+                    nexts = successors[i] = self._successors(state, useless)
 
-                    self._queue.extend(Sampler.SampleNode(
-                        next_state, node) for next_state in next_states)
+                for next_state in nexts:
+                    queue.append(Node(next_state, node))
 
-        return list(sorted(self._samples, key=lambda s: (len(s), s))[:max_samples])
+        # one accepting node can add a whole product of words, so the set may
+        # hold far more than max_samples: select the shortlex-smallest ones
+        # with a bounded heap instead of sorting everything
+        return heapq.nsmallest(max_samples, self._samples, key=lambda s: (len(s), s))
@@ -1,5 +1,6 @@
 import re
-from typing import Mapping, Tuple
+from itertools import product
+from typing import Iterator, Mapping, Sequence, Tuple
 
 
 def cprint(message: str, color: str = "reset", *, bold: bool = False, end: str = "\n") -> None:
@@ -122,20 +123,134 @@ def words_for_path(state_seq: list[str], edges: Mapping[str, Mapping[str, Tuple[
     if len(state_seq) < 2:
         raise ValueError("Path must contain at least two states.")
 
-    words: set[str] = {""}
-    for i in range(1, len(state_seq)):
-        src, dst = state_seq[i - 1], state_seq[i]
-
-        if src not in edges:
+    # look up every hop first, then build each word once from the product of
+    # the hop labels instead of re-concatenating all prefixes at every step
+    hops: list[Tuple[str, ...]] = []
+    for src, dst in zip(state_seq, state_seq[1:]):
+        out = edges.get(src)
+        if out is None:
             raise ValueError(f"No outgoing transitions from state {src!r}")
 
-        if dst not in edges[src]:
+        letters = out.get(dst)
+        if letters is None:
             raise ValueError(f"No transition from {src!r} to {dst!r}")
 
-        letters = edges[src][dst]
         if not letters:
             raise ValueError(f"Transition {src!r} -> {dst!r} has no symbols")
 
-        words = {w + letter for w in words for letter in letters}
+        hops.append(letters)
+
+    return {"".join(word) for word in product(*hops)}
+
+
+# _BYTE_BITS[b] = positions of the set bits of byte b, lowest first
+_BYTE_BITS = tuple(tuple(i for i in range(8) if b >> i & 1) for b in range(256))
+
+
+def bit_indices(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of `mask`, lowest first."""
+    if mask.bit_length() <= 64:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+        return
 
-    return words
+    # past one machine word, clearing bits one at a time copies the whole
+    # int per bit; walk the packed bytes instead, skipping empty ones
+    raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for base, byte in enumerate(raw):
+        if byte:
+            base *= 8
+            for i in _BYTE_BITS[byte]:
+                yield base + i
+
+
+# _BIT_FLAGS[b] spells byte b as 8 flag bytes, lowest bit first
+_BIT_FLAGS = tuple(bytes((b >> i) & 1 for i in range(8)) for b in range(256))
+
+
+def mask_flags(mask: int, n: int) -> bytearray:
+    """
+    Expand the low n bits of `mask` into a flag vector: flags[i] == 1 iff
+    bit i is set. One table lookup per byte, instead of a shift of the whole
+    int per position.
+    """
+    raw = (mask & ((1 << n) - 1)).to_bytes((n + 7) // 8, "little")
+    return bytearray(b"".join(map(_BIT_FLAGS.__getitem__, raw))[:n])
+
+
+def mask_closure(start: int, step: Sequence[int]) -> int:
+    """
+    Bitmask of every node reachable from the nodes in `start` (included),
+    where step[i] is the bitmask of node i's neighbours. A frontier sweep:
+    each round ORs the rows of the newly reached nodes only.
+    """
+    seen = frontier = start
+    while frontier:
+        nxt = 0
+        for i in bit_indices(frontier):
+            nxt |= step[i]
+        frontier = nxt & ~seen
+        seen |= frontier
+    return seen
+
+
+def strongly_connected_components(succ: Sequence[Sequence[int]]) -> list[list[int]]:
+    """
+    Tarjan's SCC algorithm over nodes 0..n-1, where succ[v] lists the
+    successors of v. Iterative, so long chains don't hit the recursion limit.
+
+    Returns:
+        The SCCs in reverse topological order: every SCC comes after all
+        the SCCs it can reach.
+    """
+    n = len(succ)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    sccs: list[list[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+
+        while work:
+            v, pos = work[-1]
+            if pos < len(succ[v]):
+                work[-1] = (v, pos + 1)
+                w = succ[v][pos]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+
+            if low[v] == index[v]:
+                component: list[int] = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                sccs.append(component)
+
+    return sccs
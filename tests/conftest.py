@@ -18,12 +18,13 @@ def make_dfa(
 ) -> DFA:
     """
     Helper: construct DFA with given components. Your DFA/Automaton __post_init__
-    will freeze sets and generate edges as nested MappingProxyType with tuple labels.
+    will freeze sets and generate edges as nested MappingProxyType with tuple labels,
+    so δ is passed through as it is, without a defensive copy.
     """
     return DFA(
         Q=frozenset(Q),
         Σ=frozenset(Σ),
-        δ={(k[0], k[1]): v for k, v in δ.items()},
+        δ=δ,
         q0=q0,
         F=frozenset(F),
     )
@@ -43,7 +44,7 @@ def make_nfa(
     return NFA(
         Q=frozenset(Q),
         Σ=frozenset(Σ),
-        δ={(k[0], k[1]): frozenset(v) for k, v in δ.items()},
+        δ={k: frozenset(v) for k, v in δ.items()},
         q0=q0,
         F=frozenset(F),
     )
@@ -95,3 +96,46 @@ def dfa_multi_accept(tmp_path: Path):
     1,2
     """
     return parse_dfa_file(str(write_dfauto(tmp_path, content)))
+
+
+# NFAs are immutable, so the shared operands below are built once per session
+@pytest.fixture(scope="session")
+def a_plus_nfa() -> NFA:
+    # a+ : q0 -a-> q1, q1 -a-> q1, F={q1}
+    return make_nfa(
+        Q={"q0", "q1"},
+        Σ={"a"},
+        δ={
+            ("q0", "a"): {"q1"},
+            ("q1", "a"): {"q1"},
+        },
+        q0="q0",
+        F={"q1"},
+    )
+
+
+@pytest.fixture(scope="session")
+def b_plus_nfa() -> NFA:
+    # b+ : p0 -b-> p1, p1 -b-> p1, F={p1}
+    return make_nfa(
+        Q={"p0", "p1"},
+        Σ={"b"},
+        δ={
+            ("p0", "b"): {"p1"},
+            ("p1", "b"): {"p1"},
+        },
+        q0="p0",
+        F={"p1"},
+    )
+
+
+@pytest.fixture(scope="session")
+def epsilon_nfa() -> NFA:
+    # {ε} : start is accepting, no edges
+    return make_nfa(Q={"s"}, Σ=set(), δ={}, q0="s", F={"s"})
+
+
+@pytest.fixture(scope="session")
+def empty_nfa() -> NFA:
+    # ∅ over {a}: no accepting states, no edges
+    return make_nfa(Q={"x0"}, Σ={"a"}, δ={}, q0="x0", F=set())
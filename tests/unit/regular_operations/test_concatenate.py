@@ -148,6 +148,8 @@ def test_concatenate_multiple_accepting_states_bridge_each():
     # Both accepting states should have ε-edges to nfa2 start
     assert u.δ[("nfa1_f1", Epsilon)] == frozenset({"nfa2_p0"})
     assert u.δ[("nfa1_f2", Epsilon)] == frozenset({"nfa2_p0"})
+    # ...and share a single destination set
+    assert u.δ[("nfa1_f1", Epsilon)] is u.δ[("nfa1_f2", Epsilon)]
 
     # Accepting set as defined: only the nfa2 accepts
     assert u.F == {"nfa2_p1"}
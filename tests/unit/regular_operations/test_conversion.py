@@ -1,34 +1,20 @@
 from automata.automaton import Epsilon
 from automata.dfa import DFA
+from automata.nfa import NFA
 from automata.operations import convert_nfa_to_dfa
 from tests.conftest import make_nfa
 
 
 def _is_total_dfa(dfa: DFA):
-    for q in dfa.Q:
-        for a in dfa.Σ:
-            if (q, a) not in dfa.δ:
-                return False
-    return True
+    return all((q, a) in dfa.δ for q in dfa.Q for a in dfa.Σ)
 
 
 # ───────────────────────────────
 # 🔹 1) a+  → DFA with start then accepting loop
 # ───────────────────────────────
-def test_convert_simple_a_plus():
+def test_convert_simple_a_plus(a_plus_nfa: NFA):
     # NFA for a+ : q0 -a-> q1 ; q1 -a-> q1 ; F={q1}
-    nfa = make_nfa(
-        Q={"q0", "q1"},
-        Σ={"a"},
-        δ={
-            ("q0", "a"): {"q1"},
-            ("q1", "a"): {"q1"},
-        },
-        q0="q0",
-        F={"q1"},
-    )
-
-    dfa = convert_nfa_to_dfa(nfa)
+    dfa = convert_nfa_to_dfa(a_plus_nfa)
 
     # start state's name is "q_start" per your function
     assert dfa.q0 == "q_start"
@@ -149,3 +135,46 @@ def test_convert_nondet_union_of_moves():
     # From start on 'a' must be accepting because subset includes 'y'
     s1 = dfa.δ[(dfa.q0, "a")]
     assert s1 in dfa.F
+
+
+# ───────────────────────────────
+# 🔹 6) Empty language via unreachable accepting state → single looping state
+# ───────────────────────────────
+def test_convert_unreachable_accepting_state_is_empty_language():
+    nfa = make_nfa(
+        Q={"q0", "q1", "f"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): {"q1"},
+            ("q1", Epsilon): {"q0"},
+            ("f", "b"): {"f"},
+        },
+        q0="q0",
+        F={"f"},
+    )
+
+    dfa = convert_nfa_to_dfa(nfa)
+    assert dfa.Q == {"q_start"}
+    assert dfa.F == set()
+    assert all(dfa.δ[("q_start", a)] == "q_start" for a in dfa.Σ)
+
+
+# ───────────────────────────────
+# 🔹 7) Only reachable subsets are built: a chain stays linear in size
+# ───────────────────────────────
+def test_convert_chain_builds_only_reachable_subsets():
+    n = 24
+    nfa = make_nfa(
+        Q={f"s{i}" for i in range(n)},
+        Σ={"a"},
+        δ={(f"s{i}", "a"): {f"s{i + 1}"} for i in range(n - 1)},
+        q0="s0",
+        F={f"s{n - 1}"},
+    )
+
+    dfa = convert_nfa_to_dfa(nfa)
+    assert _is_total_dfa(dfa)
+    # one state per chain position plus the empty-subset sink
+    assert len(dfa.Q) <= n + 1
+    assert dfa.accepts("a" * (n - 1))
+    assert not dfa.accepts("a" * n)
@@ -16,20 +16,10 @@ def _samples(auto: DFA | NFA, *, max_samples: int = 12, max_depth: int = 6):
 # ───────────────────────────────
 # 🔹 1) a+  → languages match
 # ───────────────────────────────
-def test_convert_a_plus_sampler_equivalence():
-    nfa = make_nfa(
-        Q={"q0", "q1"},
-        Σ={"a"},
-        δ={
-            ("q0", "a"): {"q1"},
-            ("q1", "a"): {"q1"},
-        },
-        q0="q0",
-        F={"q1"},
-    )
-    dfa = convert_nfa_to_dfa(nfa)
+def test_convert_a_plus_sampler_equivalence(a_plus_nfa: NFA):
+    dfa = convert_nfa_to_dfa(a_plus_nfa)
 
-    nfa_samples = _samples(nfa, max_samples=6, max_depth=6)
+    nfa_samples = _samples(a_plus_nfa, max_samples=6, max_depth=6)
     dfa_samples = _samples(dfa, max_samples=6, max_depth=6)
 
     assert nfa_samples == dfa_samples == {
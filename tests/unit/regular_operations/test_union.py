@@ -1,5 +1,7 @@
 from automata.automaton import Epsilon
-from automata.operations import union
+from automata.minimization import minimize
+from automata.nfa import NFA
+from automata.operations import convert_nfa_to_dfa, result_cache, union, union_to_dfa
 from tests.conftest import make_nfa
 
 # ───────────────────────────────
@@ -7,31 +9,10 @@ from tests.conftest import make_nfa
 # ───────────────────────────────
 
 
-def test_union_basic_structure_and_prefixing():
+def test_union_basic_structure_and_prefixing(a_plus_nfa: NFA, b_plus_nfa: NFA):
     # nfa1 accepts a+ : q0 -a-> q1, q1 -a-> q1, F={q1}
-    nfa1 = make_nfa(
-        Q={"q0", "q1"},
-        Σ={"a"},
-        δ={
-            ("q0", "a"): {"q1"},
-            ("q1", "a"): {"q1"},
-        },
-        q0="q0",
-        F={"q1"},
-    )
     # nfa2 accepts b+ : p0 -b-> p1, p1 -b-> p1, F={p1}
-    nfa2 = make_nfa(
-        Q={"p0", "p1"},
-        Σ={"b"},
-        δ={
-            ("p0", "b"): {"p1"},
-            ("p1", "b"): {"p1"},
-        },
-        q0="p0",
-        F={"p1"},
-    )
-
-    u = union(nfa1, nfa2)
+    u = union(a_plus_nfa, b_plus_nfa)
 
     # Alphabet is union
     assert u.Σ == {"a", "b"}
@@ -62,14 +43,8 @@ def test_union_basic_structure_and_prefixing():
 # 🔹 2) Union preserves ε-acceptance when an operand accepts ε
 #     (nfa1 accepts ε via q0∈F; nfa2 accepts a+)
 # ───────────────────────────────
-def test_union_preserves_empty_string_acceptance_via_epsilon():
-    nfa1 = make_nfa(
-        Q={"s"},
-        Σ=set(),
-        δ={},            # no edges; start is accepting => accepts ε
-        q0="s",
-        F={"s"},
-    )
+def test_union_preserves_empty_string_acceptance_via_epsilon(epsilon_nfa: NFA):
+    # nfa1: no edges; start is accepting => accepts ε
     nfa2 = make_nfa(
         Q={"t0", "t1"},
         Σ={"a"},
@@ -81,7 +56,7 @@ def test_union_preserves_empty_string_acceptance_via_epsilon():
         F={"t1"},
     )
 
-    u = union(nfa1, nfa2)
+    u = union(epsilon_nfa, nfa2)
 
     # Accepting set includes prefixed accepting start of nfa1
     assert "nfa1_s" in u.F
@@ -94,45 +69,26 @@ def test_union_preserves_empty_string_acceptance_via_epsilon():
 # 🔹 3) Union with one empty-language operand (no accepting states)
 #     Should behave like the other operand; minimize may prune the dead side.
 # ───────────────────────────────
-def test_union_with_empty_language_operand():
-    # nfa1 accepts nothing
-    nfa1 = make_nfa(
-        Q={"x0"},
-        Σ={"a"},
-        δ={},            # no path to acceptance
-        q0="x0",
-        F=set(),
-    )
-    # nfa2 accepts b+
-    nfa2 = make_nfa(
-        Q={"y0", "y1"},
-        Σ={"b"},
-        δ={
-            ("y0", "b"): {"y1"},
-            ("y1", "b"): {"y1"},
-        },
-        q0="y0",
-        F={"y1"},
-    )
-
-    u = union(nfa1, nfa2, should_minimize=False)
+def test_union_with_empty_language_operand(empty_nfa: NFA, b_plus_nfa: NFA):
+    # nfa1 accepts nothing, nfa2 accepts b+
+    u = union(empty_nfa, b_plus_nfa, should_minimize=False)
 
     # Alphabet is union even if one side is empty-language
     assert u.Σ == {"a", "b"}
 
     # ε-link from union start always points to both prefixed starts
     assert ("q_start", Epsilon) in u.δ
-    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa1_x0", "nfa2_y0"})
+    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa1_x0", "nfa2_p0"})
 
     # Accepting set mirrors the non-empty operand
-    assert u.F == {"nfa2_y1"}
+    assert u.F == {"nfa2_p1"}
 
     # Ensure nfa2 transitions survived with proper prefix
-    assert u.δ[("nfa2_y0", "b")] == frozenset({"nfa2_y1"})
-    assert u.δ[("nfa2_y1", "b")] == frozenset({"nfa2_y1"})
+    assert u.δ[("nfa2_p0", "b")] == frozenset({"nfa2_p1"})
+    assert u.δ[("nfa2_p1", "b")] == frozenset({"nfa2_p1"})
 
     # No stray "a" transitions were invented
-    assert ("nfa2_y0", "a") not in u.δ and ("nfa2_y1", "a") not in u.δ
+    assert ("nfa2_p0", "a") not in u.δ and ("nfa2_p1", "a") not in u.δ
 
 
 # ───────────────────────────────
@@ -175,38 +131,20 @@ def test_union_overlapping_alphabet_no_cross_wiring():
 # ───────────────────────────────
 
 
-def test_union_trims_dead_operand_when_minimized():
-    nfa1 = make_nfa(
-        Q={"x0"},
-        Σ={"a"},
-        δ={},            # no path to acceptance
-        q0="x0",
-        F=set(),
-    )
-    nfa2 = make_nfa(
-        Q={"y0", "y1"},
-        Σ={"b"},
-        δ={
-            ("y0", "b"): {"y1"},
-            ("y1", "b"): {"y1"},
-        },
-        q0="y0",
-        F={"y1"},
-    )
-
-    u = union(nfa1, nfa2)  # default: should_minimize=True
+def test_union_trims_dead_operand_when_minimized(empty_nfa: NFA, b_plus_nfa: NFA):
+    u = union(empty_nfa, b_plus_nfa)  # default: should_minimize=True
 
     # All nfa1_* states should be gone after trim
     assert all(not s.startswith("nfa1_") for s in u.Q)
 
     # ε from start should now only target the live side's start
     assert ("q_start", Epsilon) in u.δ
-    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa2_y0"})
+    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa2_p0"})
 
     # Language preserved: the b+ structure is intact
-    assert u.F == {"nfa2_y1"}
-    assert u.δ[("nfa2_y0", "b")] == frozenset({"nfa2_y1"})
-    assert u.δ[("nfa2_y1", "b")] == frozenset({"nfa2_y1"})
+    assert u.F == {"nfa2_p1"}
+    assert u.δ[("nfa2_p0", "b")] == frozenset({"nfa2_p1"})
+    assert u.δ[("nfa2_p1", "b")] == frozenset({"nfa2_p1"})
 
 
 # ───────────────────────────────
@@ -229,38 +167,20 @@ def test_union_minimize_both_empty_language_keeps_only_start():
 # ───────────────────────────────
 
 
-def test_union_trims_dead_operand_minimize_simple():
-    nfa1 = make_nfa(
-        Q={"x0"},
-        Σ={"a"},
-        δ={},            # no path to acceptance
-        q0="x0",
-        F=set(),
-    )
-    nfa2 = make_nfa(
-        Q={"y0", "y1"},
-        Σ={"b"},
-        δ={
-            ("y0", "b"): {"y1"},
-            ("y1", "b"): {"y1"},
-        },
-        q0="y0",
-        F={"y1"},
-    )
-
-    u = union(nfa1, nfa2)  # default should_minimize=True
+def test_union_trims_dead_operand_minimize_simple(empty_nfa: NFA, b_plus_nfa: NFA):
+    u = union(empty_nfa, b_plus_nfa)  # default should_minimize=True
 
     # All nfa1_* states are pruned (dead component)
     assert all(not s.startswith("nfa1_") for s in u.Q)
 
     # ε from union start only points to live start
     assert ("q_start", Epsilon) in u.δ
-    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa2_y0"})
+    assert u.δ[("q_start", Epsilon)] == frozenset({"nfa2_p0"})
 
     # Live side intact
-    assert u.F == {"nfa2_y1"}
-    assert u.δ[("nfa2_y0", "b")] == frozenset({"nfa2_y1"})
-    assert u.δ[("nfa2_y1", "b")] == frozenset({"nfa2_y1"})
+    assert u.F == {"nfa2_p1"}
+    assert u.δ[("nfa2_p0", "b")] == frozenset({"nfa2_p1"})
+    assert u.δ[("nfa2_p1", "b")] == frozenset({"nfa2_p1"})
 
 
 # ───────────────────────────────
@@ -297,3 +217,61 @@ def test_union_no_cross_operand_merge_when_shapes_match():
     assert u.δ[("nfa1_acc", "a")] == frozenset({"nfa1_acc"})
     assert u.δ[("nfa2_p0", "a")] == frozenset({"nfa2_acc"})
     assert u.δ[("nfa2_acc", "a")] == frozenset({"nfa2_acc"})
+
+
+# ───────────────────────────────
+# 🔹 9) Result cache: opt-in via result_cache(), keyed by operand content
+# ───────────────────────────────
+def test_union_result_cache_is_opt_in(a_plus_nfa: NFA, b_plus_nfa: NFA):
+    # an operand equal in content to a_plus_nfa, but a different object
+    a_plus_copy = make_nfa(
+        Q={"q0", "q1"},
+        Σ={"a"},
+        δ={("q0", "a"): {"q1"}, ("q1", "a"): {"q1"}},
+        q0="q0",
+        F={"q1"},
+    )
+
+    assert union(a_plus_nfa, b_plus_nfa) is not union(a_plus_copy, b_plus_nfa)
+
+    with result_cache():
+        u = union(a_plus_nfa, b_plus_nfa)
+        assert union(a_plus_copy, b_plus_nfa) is u
+        # different arguments are different entries
+        assert union(a_plus_nfa, b_plus_nfa, should_minimize=False) is not u
+
+    # the cache does not outlive the block
+    assert union(a_plus_nfa, b_plus_nfa) is not u
+
+
+# ───────────────────────────────
+# 🔹 10) union_to_dfa: same language as converting the union NFA
+# ───────────────────────────────
+def test_union_to_dfa_matches_converted_union(
+    a_plus_nfa: NFA, b_plus_nfa: NFA, empty_nfa: NFA, epsilon_nfa: NFA
+):
+    words = ["", "a", "b", "aa", "ab", "ba", "bb", "aaa", "bbb", "aba"]
+    for nfa1, nfa2 in [
+        (a_plus_nfa, b_plus_nfa),
+        (empty_nfa, b_plus_nfa),
+        (epsilon_nfa, a_plus_nfa),
+        (a_plus_nfa, a_plus_nfa),
+    ]:
+        fused = union_to_dfa(nfa1, nfa2)
+        reference = convert_nfa_to_dfa(union(nfa1, nfa2))
+
+        assert fused.q0 == "q_start"
+        assert fused.Σ == nfa1.Σ | nfa2.Σ
+        for w in words:
+            if set(w) <= fused.Σ:
+                assert fused.accepts(w) == reference.accepts(w)
+        # state counts only agree once both are reduced to the minimal DFA
+        assert len(minimize(fused, canonical=True).Q) == len(
+            minimize(reference, canonical=True).Q)
+
+
+def test_union_to_dfa_both_empty_is_single_sink(empty_nfa: NFA):
+    dfa = union_to_dfa(empty_nfa, empty_nfa)
+    assert dfa.Q == {"q_start"}
+    assert dfa.F == set()
+    assert dfa.δ == {("q_start", "a"): "q_start"}
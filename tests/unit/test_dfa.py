@@ -1,6 +1,11 @@
+import gc
+import weakref
+
 import pytest
 
 from automata.dfa import DFA
+from automata.utils import words_for_path
+from tests.conftest import make_dfa
 
 
 def test_get_tuples_roundtrip(simple_dfa: DFA):
@@ -34,6 +39,9 @@ def test_edges_grouping(request: pytest.FixtureRequest, dfa_fixture: str):
             assert isinstance(syms, tuple)
             assert all(isinstance(x, str) for x in syms)
 
+    # built once, then reused
+    assert dfa.edges is dfa.edges
+
 
 def test_accepts(simple_dfa: DFA):
     assert simple_dfa.accepts("a") is True
@@ -41,3 +49,150 @@ def test_accepts(simple_dfa: DFA):
 
     with pytest.raises(ValueError):
         simple_dfa.accepts("x")
+
+
+def test_compile_matches_accepts(simple_dfa: DFA):
+    run = simple_dfa.compile()
+    assert simple_dfa.compile() is run  # cached per instance
+
+    for word in ["", "a", "b", "ab", "ba", "aab", "abab", "bbbb"]:
+        assert run(word) is _walk(simple_dfa, word)
+
+    with pytest.raises(ValueError):
+        run("ax")
+
+
+def test_compile_does_not_keep_dfa_alive():
+    dfa = make_dfa(Q={"q0"}, Σ={"a"}, δ={("q0", "a"): "q0"}, q0="q0", F={"q0"})
+    dfa.compile()
+    ref = weakref.ref(dfa)
+    del dfa
+    gc.collect()
+    assert ref() is None
+
+
+def test_compile_trap_states(dfa_with_trap: DFA):
+    run = dfa_with_trap.compile()
+
+    for word in ["", "a", "b", "aa", "ab", "aba", "bbbb"]:
+        assert run(word) is _walk(dfa_with_trap, word)
+
+    # symbols after falling into the trap are still validated
+    with pytest.raises(ValueError):
+        run("bx")
+
+
+def test_count_strings_of_length(simple_dfa: DFA):
+    for k in range(6):
+        brute = sum(
+            simple_dfa.accepts(w)
+            for w in _all_words(sorted(simple_dfa.Σ), k)
+        )
+        assert simple_dfa.count_strings_of_length(k) == brute
+
+
+def test_nth_string_shortlex_order(simple_dfa: DFA):
+    expected = [
+        w for k in range(5)
+        for w in _all_words(sorted(simple_dfa.Σ), k)
+        if simple_dfa.accepts(w)
+    ]
+    assert [simple_dfa.nth_string(i) for i in range(len(expected))] == expected
+
+
+def test_words_of_length_matches_brute_force(dfa_with_trap: DFA):
+    for k in range(6):
+        expected = [
+            w for w in _all_words(sorted(dfa_with_trap.Σ), k)
+            if dfa_with_trap.accepts(w)
+        ]
+        assert list(dfa_with_trap.words_of_length(k)) == expected
+    with pytest.raises(ValueError):
+        next(dfa_with_trap.words_of_length(-1))
+
+
+def test_nth_string_finite_language_out_of_range():
+    # language is {a, b}
+    dfa = make_dfa(
+        Q={"q0", "q1", "qT"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): "q1", ("q0", "b"): "q1",
+            ("q1", "a"): "qT", ("q1", "b"): "qT",
+            ("qT", "a"): "qT", ("qT", "b"): "qT",
+        },
+        q0="q0",
+        F={"q1"},
+    )
+    assert [dfa.nth_string(0), dfa.nth_string(1)] == ["a", "b"]
+    with pytest.raises(IndexError):
+        dfa.nth_string(2)
+
+
+def _walk(dfa: DFA, word: str) -> bool:
+    state = dfa.q0
+    for sym in word:
+        state = dfa.δ[(state, sym)]
+    return state in dfa.F
+
+
+def _all_words(alphabet: list[str], k: int) -> list[str]:
+    words = [""]
+    for _ in range(k):
+        words = [w + a for w in words for a in alphabet]
+    return words
+
+
+def test_non_total_transition_function_rejected():
+    with pytest.raises(ValueError, match=r"missing \(q1, b\)"):
+        make_dfa(
+            Q={"q0", "q1"},
+            Σ={"a", "b"},
+            δ={
+                ("q0", "a"): "q1", ("q0", "b"): "q0",
+                ("q1", "a"): "q1",
+            },
+            q0="q0",
+            F={"q1"},
+        )
+
+
+def test_compile_large_alphabet_matches_walk():
+    # parity of word length over a 6-symbol alphabet
+    Σ = set("abcdef")
+    dfa = make_dfa(
+        Q={"even", "odd"},
+        Σ=Σ,
+        δ={
+            **{("even", a): "odd" for a in Σ},
+            **{("odd", a): "even" for a in Σ},
+        },
+        q0="even",
+        F={"odd"},
+    )
+    run = dfa.compile()
+    for word in ["", "a", "fe", "abc", "fedcba", "ddddd"]:
+        assert run(word) is _walk(dfa, word)
+
+    for bad in ["ax", "a€", "€b"]:
+        with pytest.raises(ValueError):
+            run(bad)
+
+
+def test_words_for_path_valid(simple_dfa: DFA):
+    # every word labelling the path is one symbol per hop
+    words = words_for_path(["q0", "q1", "q2"], simple_dfa.edges)
+    assert words
+    for w in words:
+        state = "q0"
+        for c in w:
+            state = simple_dfa.δ[(state, c)]
+        assert len(w) == 2 and state == "q2"
+
+
+def test_words_for_path_invalid_edge(dfa_with_trap: DFA):
+    # qT only loops to itself
+    with pytest.raises(ValueError):
+        words_for_path(["qT", "q0"], dfa_with_trap.edges)
+    with pytest.raises(ValueError):
+        words_for_path(["q0"], dfa_with_trap.edges)
@@ -20,6 +20,34 @@ import pytest
             id="simple_valid",
         ),
 
+        # ---------- Transition indices with an explicit plus sign ----------
+        pytest.param(
+            """
+            2 [q0, q1]
+            2 [a, b]
+            +1, 0
+            1,+0
+            0
+            1
+            """,
+            True,
+            id="plus_signed_indices",
+        ),
+
+        # ---------- A form feed is whitespace inside a line, not a line break ----------
+        pytest.param(
+            """
+            2 [q0, q1]
+            1 [a]
+            1\x0c
+            0
+            0
+            1
+            """,
+            True,
+            id="form_feed_inside_line",
+        ),
+
         # ---------- Fewer states than declared ----------
         pytest.param(
             """
@@ -164,6 +192,20 @@ import pytest
             id="too_many_transition_lines",
         ),
 
+        # ---------- Negative state index in a transition row ----------
+        pytest.param(
+            """
+            2 [q0, q1]
+            2 [a, b]
+            1,-1
+            0,1
+            0
+            1
+            """,
+            False,
+            id="negative_state_index",
+        ),
+
         # ---------- Not enough lines overall (missing accept states line) ----------
         pytest.param(
             """
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 from automata.automaton import Epsilon
 from automata.minimization import find_dead_states, group_indistinguishable_states, minimize
 from tests.conftest import make_dfa, make_nfa
@@ -167,6 +171,27 @@ def test_unreachable_accepting_state():
     # q2 is accepting but unreachable, q0/q1 can’t reach it → all dead
     assert find_dead_states(dfa) == {"q0", "q1", "q2"}
 
+
+# ───────────────────────────────
+# 🔹 11. DFA: state on a cycle reaches F only through the cycle
+# ───────────────────────────────
+def test_cycle_back_to_start_is_not_dead():
+    dfa = make_dfa(
+        Q={"q0", "q1", "f"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): "q1",   # explored before q0's own edge into F
+            ("q0", "b"): "f",
+            ("q1", "a"): "q0",
+            ("q1", "b"): "q1",
+            ("f", "a"): "f",
+            ("f", "b"): "f",
+        },
+        q0="q0",
+        F={"f"},
+    )
+    assert find_dead_states(dfa) == set()
+
 # ───────────────────────────────
 # 🔹 Testing Finding Indistinguishable States
 # ───────────────────────────────
@@ -300,6 +325,50 @@ def test_group_indistinguishable_states_two_sinks_same_targets():
     expected = _as_set_of_fsets([{"A"}, {"B", "C", "D"}])
     assert groups == expected
 
+
+# ───────────────────────────────
+# 🔹 7) DFA: targets whose names share the same characters stay distinct
+# ───────────────────────────────
+def test_group_indistinguishable_states_multichar_targets_not_split():
+    dfa = make_dfa(
+        Q={"q_0", "q_1", "q_10", "q_11"},
+        Σ={"a"},
+        δ={
+            ("q_0", "a"): "q_1",
+            ("q_10", "a"): "q_11",   # same characters as "q_1", other state
+            ("q_1", "a"): "q_0",
+            ("q_11", "a"): "q_10",
+        },
+        q0="q_0",
+        F=set(),
+    )
+    groups = group_indistinguishable_states(dfa)
+    expected = _as_set_of_fsets([{"q_0"}, {"q_10"}, {"q_1"}, {"q_11"}])
+    assert groups == expected
+
+
+# ───────────────────────────────
+# 🔹 8) DFA: identical rows but different acceptance → separate groups
+# ───────────────────────────────
+def test_group_indistinguishable_states_acceptance_splits_identical_rows():
+    dfa = make_dfa(
+        Q={"r0", "r1", "r2"},
+        Σ={"a", "b"},
+        δ={
+            ("r0", "a"): "r2",
+            ("r0", "b"): "r0",
+            ("r1", "a"): "r2",
+            ("r1", "b"): "r0",
+            ("r2", "a"): "r2",
+            ("r2", "b"): "r0",
+        },
+        q0="r0",
+        F={"r1"},
+    )
+    groups = group_indistinguishable_states(dfa)
+    expected = _as_set_of_fsets([{"r0", "r2"}, {"r1"}])
+    assert groups == expected
+
 # ───────────────────────────────
 # 🔹 Testing Minimize function
 # ───────────────────────────────
@@ -635,3 +704,203 @@ def test_minimize_nfa_idempotent():
     assert m1.Q == m2.Q
     assert m1.F == m2.F
     assert m1.δ == m2.δ
+
+
+# ───────────────────────────────
+# 🔹 16) NFA: same Σ rows but different ε rows → not merged
+# ───────────────────────────────
+def test_minimize_nfa_keeps_states_with_different_epsilon_rows():
+    nfa = make_nfa(
+        Q={"q0", "p", "r", "f"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): {"p"},
+            ("q0", "b"): {"r"},
+            ("p", "a"): {"f"},
+            ("p", Epsilon): {"f"},   # only p reaches F without reading
+            ("r", "a"): {"f"},
+        },
+        q0="q0",
+        F={"f"},
+    )
+    m = minimize(nfa)
+    assert {"p", "r"} <= m.Q
+    assert m.accepts("a") and m.accepts("ba")
+    assert not m.accepts("b")
+
+
+# ───────────────────────────────
+# 🔹 17) Minimizing a settled result returns it as is
+# ───────────────────────────────
+def test_minimize_of_minimized_returns_same_object():
+    dfa = make_dfa(
+        Q={"q0", "q1", "q2"},
+        Σ={"a"},
+        δ={("q0", "a"): "q1", ("q1", "a"): "q2", ("q2", "a"): "q2"},
+        q0="q0",
+        F={"q2"},
+    )
+    m = minimize(dfa)
+    assert minimize(m) is m
+
+
+# ───────────────────────────────
+# 🔹 18) NFA: ε-chain longer than the recursion limit
+# ───────────────────────────────
+def test_minimize_nfa_long_epsilon_chain():
+    n = sys.getrecursionlimit() + 100
+    Q = {f"e{i}" for i in range(n)}
+    δ = {(f"e{i}", Epsilon): {f"e{i + 1}"} for i in range(n - 1)}
+    nfa = make_nfa(Q=Q, Σ={"a"}, δ=δ, q0="e0", F={f"e{n - 1}"})
+
+    assert nfa.epsilon_closure("e0") == Q
+    assert find_dead_states(nfa) == set()
+    m = minimize(nfa)
+    assert m.accepts("")
+    assert not m.accepts("a")
+
+
+# ───────────────────────────────
+# 🔹 19) The reverse index is built once per automaton and shared
+# ───────────────────────────────
+def test_reverse_index_cached_on_automaton():
+    dfa = make_dfa(
+        Q={"q0", "q1", "q2"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): "q1",
+            ("q0", "b"): "q2",
+            ("q1", "a"): "q1",
+            ("q1", "b"): "q2",
+            ("q2", "a"): "q2",
+            ("q2", "b"): "q2",
+        },
+        q0="q0",
+        F={"q1"},
+    )
+    assert find_dead_states(dfa) == {"q2"}
+    preds = dfa._pred_masks
+
+    minimize(dfa)
+    assert dfa._pred_masks is preds
+
+    ids = dfa._state_ids
+    assert preds[ids["q1"]] == 1 << ids["q0"] | 1 << ids["q1"]
+    assert preds[ids["q0"]] == 0
+
+
+# ───────────────────────────────
+# 🔹 20) canonical=True: equivalent states on a cycle are merged
+# ───────────────────────────────
+def test_minimize_canonical_merges_equivalent_cycle():
+    dfa = make_dfa(
+        Q={"s0", "s1"},
+        Σ={"a"},
+        δ={("s0", "a"): "s1", ("s1", "a"): "s0"},
+        q0="s0",
+        F={"s0", "s1"},
+    )
+    m = minimize(dfa, canonical=True)
+    assert m.Q == {"s0"}
+    assert m.F == {"s0"}
+    assert m.δ == {("s0", "a"): "s0"}
+
+
+# ───────────────────────────────
+# 🔹 21) canonical=True: a dead q0 is its own sink
+# ───────────────────────────────
+def test_minimize_canonical_dead_start_is_single_state():
+    dfa = make_dfa(
+        Q={"x", "y"},
+        Σ={"a", "b"},
+        δ={("x", "a"): "y", ("x", "b"): "x", ("y", "a"): "y", ("y", "b"): "x"},
+        q0="x",
+        F=set(),
+    )
+    m = minimize(dfa, canonical=True)
+    assert m.Q == {"x"}
+    assert m.F == set()
+    assert m.δ == {("x", "a"): "x", ("x", "b"): "x"}
+
+
+# ───────────────────────────────
+# 🔹 22) canonical=True is only defined for DFAs
+# ───────────────────────────────
+def test_minimize_canonical_rejects_nfa():
+    nfa = make_nfa(Q={"q0"}, Σ={"a"}, δ={("q0", "a"): {"q0"}}, q0="q0", F={"q0"})
+    with pytest.raises(ValueError):
+        minimize(nfa, canonical=True)
+
+
+# ───────────────────────────────
+# 🔹 23) canonical=True: a counter mod 60 accepting multiples of 4 → 4 states
+# ───────────────────────────────
+def test_minimize_canonical_counter_collapses_to_period():
+    n = 60
+    dfa = make_dfa(
+        Q={f"c{i:02}" for i in range(n)},
+        Σ={"a", "b"},
+        δ={
+            **{(f"c{i:02}", "a"): f"c{(i + 1) % n:02}" for i in range(n)},
+            **{(f"c{i:02}", "b"): f"c{i:02}" for i in range(n)},
+        },
+        q0="c00",
+        F={f"c{i:02}" for i in range(0, n, 4)},
+    )
+    m = minimize(dfa, canonical=True)
+    assert m.Q == {"c00", "c01", "c02", "c03"}
+    assert m.F == {"c00"}
+    assert m.δ[("c03", "a")] == "c00"
+
+
+# ───────────────────────────────
+# 🔹 24) Dead states past the first 64 ids are found too
+# ───────────────────────────────
+def test_find_dead_states_beyond_one_machine_word():
+    # s000 → … → s099 with F = {s069}: everything after s069 is dead
+    n = 100
+    dfa = make_dfa(
+        Q={f"s{i:03}" for i in range(n)},
+        Σ={"a"},
+        δ={(f"s{i:03}", "a"): f"s{min(i + 1, n - 1):03}" for i in range(n)},
+        q0="s000",
+        F={"s069"},
+    )
+    assert find_dead_states(dfa) == {f"s{i:03}" for i in range(70, n)}
+
+
+# ───────────────────────────────
+# 🔹 25) Nothing to trim or merge: the input is returned as is
+# ───────────────────────────────
+def test_minimize_returns_input_when_nothing_changes():
+    dfa = make_dfa(
+        Q={"s0", "s1"},
+        Σ={"a", "b"},
+        δ={
+            ("s0", "a"): "s1", ("s0", "b"): "s0",
+            ("s1", "a"): "s0", ("s1", "b"): "s1",
+        },
+        q0="s0",
+        F={"s1"},
+    )
+    assert minimize(dfa) is dfa
+    assert minimize(dfa, canonical=True) is dfa
+
+
+# ───────────────────────────────
+# 🔹 26) NFA: merging a state with its ε-target leaves no ε self-loop
+# ───────────────────────────────
+def test_minimize_nfa_merge_drops_epsilon_self_loop():
+    # s and t are both accepting with no Σ rows; s -ε-> t
+    nfa = make_nfa(
+        Q={"s", "t"},
+        Σ={"a"},
+        δ={("s", Epsilon): {"t"}, ("t", Epsilon): {"t"}},
+        q0="s",
+        F={"s", "t"},
+    )
+    m = minimize(nfa)
+    assert m.Q == {"s"}
+    assert m.δ == {}
+    assert m.accepts("")
+    assert not m.accepts("a")
@@ -4,11 +4,12 @@ from typing import Mapping, Tuple
 
 from automata.automaton import Epsilon, Symbol, sym_sort_key
 from automata.nfa import NFA
+from automata.utils import words_for_path
 
 from tests.conftest import NFATransition, make_nfa
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def nfa_with_epsilon_and_multi() -> NFA:
     # States: q0 start; qf accept
     # Epsilon from q0 to q1 and q2
@@ -29,7 +30,7 @@ def nfa_with_epsilon_and_multi() -> NFA:
     return make_nfa(Q, Σ, δ, q0="q0", F={"qf"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def nfa_mixed_labels() -> NFA:
     """
     q0 -- 'b','a',ε --> q1
@@ -104,6 +105,18 @@ def test_edges_missing_src_absent(nfa_with_epsilon_and_multi: NFA):
     assert "qf" not in e
 
 
+def test_edges_src_with_only_empty_rows_absent():
+    # the parser writes an empty row for every empty cell; those rows must
+    # not make their source appear with no destinations
+    Q = {"q0", "q1"}
+    Σ = {"a"}
+    δ: NFATransition = {("q0", "a"): {"q1"}, ("q1", "a"): set()}
+    e = make_nfa(Q, Σ, δ, q0="q0", F={"q1"}).edges
+    assert "q1" not in e
+    with pytest.raises(ValueError, match="No outgoing transitions"):
+        words_for_path(["q1", "q0"], e)
+
+
 def test_edges_types_and_readonly(nfa_mixed_labels: NFA):
     e = nfa_mixed_labels.edges
     assert isinstance(e, Mapping)
@@ -145,6 +158,19 @@ def test_edge_ordering_per_destination(nfa_mixed_labels: NFA):
     assert e["q1"]["q1"] == ("a",)
 
 
+def test_equal_edge_labels_share_one_tuple():
+    Q = {"q0", "q1", "q2"}
+    Σ = {"a", "b"}
+    δ: NFATransition = {
+        ("q0", "a"): {"q1", "q2"},
+        ("q1", "a"): {"q2"},
+        ("q2", "b"): {"q0"},
+    }
+    e = make_nfa(Q, Σ, δ, q0="q0", F={"q2"}).edges
+    assert e["q0"]["q1"] == ("a",)
+    assert e["q0"]["q1"] is e["q0"]["q2"] is e["q1"]["q2"]
+
+
 def test_edges_do_not_inject_fake_labels(nfa_mixed_labels: NFA):
     """
     Ensure no extra labels get added beyond δ.
@@ -264,6 +290,20 @@ def test_transition_no_move_returns_empty_set():
     assert got == set()
 
 
+def test_unknown_state_has_trivial_closure_and_no_moves():
+    """
+    A state outside Q is its own ε-closure and moves nowhere.
+    """
+    Q = {"q0", "q1"}
+    Σ = {"a"}
+    δ: NFATransition = {("q0", "a"): {"q1"}, ("q0", Epsilon): {"q1"}}
+    nfa = make_nfa(Q, Σ, δ, q0="q0", F={"q1"})
+
+    assert nfa.epsilon_closure("zz") == {"zz"}
+    assert nfa.transition("zz", "a") == set()
+    assert nfa.transition("zz", Epsilon) == set()
+
+
 def test_transition_multiple_targets_and_post_closures():
     """
     q0 -ε-> q1
@@ -403,6 +443,16 @@ def test_accepts_rejects_when_no_valid_move():
     assert nfa.accepts("aa") is False  # second 'a' has no edge from q1
 
 
+def test_accepts_validates_symbols_after_frontier_empties():
+    Q = {"q0", "q1"}
+    Σ = {"a", "b"}
+    δ: NFATransition = {("q0", "a"): {"q1"}}
+    nfa = make_nfa(Q, Σ, δ, q0="q0", F={"q1"})
+    assert nfa.accepts("b" + "a" * 1000) is False
+    with pytest.raises(ValueError):
+        nfa.accepts("bax")  # dead after 'b', but 'x' is still not in Σ
+
+
 def test_accepts_raises_on_invalid_symbol():
     Q = {"q0", "q1"}
     Σ = {"a"}  # 'b' not in Σ
@@ -549,3 +599,117 @@ def test_closed_edges_ignores_symbols_with_no_reachable_dests():
     # no destination under 'b' → no extra entries
     # (no assertion needed other than absence of spurious keys)
     assert all("b" not in labels for labels in ce["q0"].values())
+
+
+def test_epsilon_closure_shared_within_cycle_and_chained():
+    """
+    q0 <-ε-> q1 (cycle), q1 -ε-> q2 -ε-> q3, q3 -ε-> q2 (second cycle)
+    Both cycles collapse to one closure each; the first reaches the second.
+    """
+    Q = {"q0", "q1", "q2", "q3", "q4"}
+    Σ = {"a"}
+    δ: NFATransition = {
+        ("q0", Epsilon): {"q1"},
+        ("q1", Epsilon): {"q0", "q2"},
+        ("q2", Epsilon): {"q3"},
+        ("q3", Epsilon): {"q2"},
+        ("q3", "a"): {"q4"},
+    }
+    nfa = make_nfa(Q, Σ, δ, q0="q0", F={"q4"})
+
+    assert nfa.epsilon_closure("q0") == {"q0", "q1", "q2", "q3"}
+    assert nfa.epsilon_closure("q1") == {"q0", "q1", "q2", "q3"}
+    assert nfa.epsilon_closure("q2") == {"q2", "q3"}
+    assert nfa.epsilon_closure("q3") == {"q2", "q3"}
+    assert nfa.epsilon_closure("q4") == {"q4"}
+
+    # equal closures are one pooled set
+    assert nfa.epsilon_closure("q0") is nfa.epsilon_closure("q1")
+    assert nfa.epsilon_closure("q2") is nfa.epsilon_closure("q3")
+
+
+def test_remove_states_prunes_rows():
+    Q = {"q0", "q1", "q2"}
+    Σ = {"a", "b"}
+    δ: NFATransition = {
+        ("q0", "a"): {"q1", "q2"},
+        ("q0", "b"): {"q2"},
+        ("q1", "a"): {"q0"},
+        ("q2", "b"): {"q0"},
+    }
+    nfa = make_nfa(Q, Σ, δ, q0="q0", F={"q1", "q2"})
+
+    trimmed = nfa.remove_states({"q2"})
+    assert trimmed.Q == {"q0", "q1"}
+    assert trimmed.F == {"q1"}
+    # rows emptied by the removal are dropped, untouched rows are reused
+    assert dict(trimmed.δ) == {
+        ("q0", "a"): {"q1"},
+        ("q1", "a"): {"q0"},
+    }
+    assert trimmed.δ[("q1", "a")] is nfa.δ[("q1", "a")]
+    assert trimmed.accepts("a") and not trimmed.accepts("b")
+
+
+def test_epsilon_closures_match_warshall_closure():
+    # ε-subgraph with a cycle, a chain into it, and an isolated state
+    Q = {"q0", "q1", "q2", "q3", "q4", "q5"}
+    Σ = {"a"}
+    δ: NFATransition = {
+        ("q0", Epsilon): {"q1", "q4"},
+        ("q1", Epsilon): {"q2"},
+        ("q2", Epsilon): {"q3"},
+        ("q3", Epsilon): {"q1"},
+        ("q4", "a"): {"q2"},
+        ("q5", "a"): {"q0"},
+    }
+    nfa = make_nfa(Q, Σ, δ, q0="q0", F={"q3"})
+
+    # reference: reflexive Warshall closure of the ε-adjacency bitmatrix
+    names = sorted(Q)
+    reach = [1 << i for i in range(len(names))]
+    for (src, sym), dsts in δ.items():
+        if sym is Epsilon:
+            for d in dsts:
+                reach[names.index(src)] |= 1 << names.index(d)
+    for k in range(len(names)):
+        for i in range(len(names)):
+            if reach[i] >> k & 1:
+                reach[i] |= reach[k]
+
+    for i, q in enumerate(names):
+        expected = {names[j] for j in range(len(names)) if reach[i] >> j & 1}
+        assert nfa.epsilon_closure(q) == expected
+
+    assert nfa.transition("q5", "a") == {"q0", "q1", "q2", "q3", "q4"}
+    assert nfa.transition("q0", "a") == {"q1", "q2", "q3"}
+
+
+def test_epsilon_is_a_singleton_across_copy_and_pickle():
+    import copy
+    import pickle
+
+    from automata.automaton import _Epsilon
+
+    assert _Epsilon() is Epsilon
+    assert copy.copy(Epsilon) is Epsilon
+    assert copy.deepcopy(Epsilon) is Epsilon
+    assert pickle.loads(pickle.dumps(Epsilon)) is Epsilon
+
+    # a copied δ still finds its ε rows with the module-level sentinel
+    δ = copy.deepcopy({("q0", Epsilon): frozenset({"q1"})})
+    assert δ[("q0", Epsilon)] == {"q1"}
+
+
+def test_destination_collections_are_stored_as_shared_frozensets():
+    nfa = NFA(
+        Q=frozenset({"q0", "q1"}),
+        Σ=frozenset({"a", "b"}),
+        δ={("q0", "a"): ["q1"], ("q0", "b"): ("q1",), ("q1", Epsilon): {"q0"}},
+        q0="q0",
+        F=frozenset({"q1"}),
+    )
+
+    assert all(type(dsts) is frozenset for dsts in nfa.δ.values())
+    assert nfa.δ[("q0", "a")] is nfa.δ[("q0", "b")]
+    assert nfa.accepts("a") and nfa.accepts("ba")
@@ -161,3 +161,30 @@ def test_sampler_deterministic_sorting():
     out = Sampler(dfa).sample(max_samples=6, max_depth=4)
     # Shorter first; among equals, lexicographic: 'a' < 'b' < 'aa' < 'ab' < 'ba' < 'bb'
     assert out == ["a", "b", "aa", "ab", "ba", "bb"]
+
+
+# ───────────────────────────────
+# 🔹 9) Fresh Samplers over one automaton share its analysis, not their state
+# ───────────────────────────────
+def test_sampler_reuses_per_automaton_analysis():
+    dfa = make_dfa(
+        Q={"q0", "acc", "dead"},
+        Σ={"a", "b"},
+        δ={
+            ("q0", "a"): "acc",
+            ("q0", "b"): "dead",
+            ("acc", "a"): "acc",
+            ("acc", "b"): "dead",
+            ("dead", "a"): "dead",
+            ("dead", "b"): "dead",
+        },
+        q0="q0",
+        F={"acc"},
+    )
+    first, second = Sampler(dfa), Sampler(dfa)
+    assert first._dead_end_states() == {"dead"}
+    assert second._dead_end_states() is first._dead_end_states()
+
+    # each Sampler still starts its own search from q0
+    assert first.sample(max_samples=3, max_depth=5) == ["a", "aa", "aaa"]
+    assert second.sample(max_samples=3, max_depth=5) == ["a", "aa", "aaa"]